@@ -21,6 +21,7 @@ from .parsers.registro_parser import RegistroParser
 from .parsers.dni_parser import DniParser
 from .parsers.calculo_parser import CalculoParser
 from .parsers.ficha_parser import FichaParser
+from .parsers import parse_batch
 from openpyxl.drawing.image import Image as XLImage
 
 
@@ -39,6 +40,9 @@ class MatrixGenerator:
         'CALCULO': CalculoParser,
         'FICHA': FichaParser,
     }
+
+    # Parsers that read `context_data` (the documents parsed before them)
+    CONTEXT_PARSERS = {'DECLARACION', 'FICHA'}
     
     DOCUMENT_PATTERNS = {
         'CONTRATO': [
@@ -124,8 +128,14 @@ class MatrixGenerator:
         
         return None
     
-    def parse_all_documents(self):
-        """Parse all documents in folder recursively"""
+    def parse_all_documents(self, workers: Optional[int] = 1):
+        """
+        Parse all documents in folder recursively.
+
+        `workers` > 1 parses the context-free parsers in a process pool of
+        that size (None = one per CPU). The default, 1, parses everything in
+        this process.
+        """
         print(f"\n📄 Parsing documents from: {self.folder_path}")
         
         supported_extensions = {'.pdf', '.jpg', '.jpeg', '.png'}
@@ -174,6 +184,22 @@ class MatrixGenerator:
         if "DECLARACION" in found_docs:
             ordered_types.append("DECLARACION")
 
+        # Los parsers que no leen context_data son independientes: con
+        # workers > 1 se parsean en paralelo antes del bucle ordenado
+        prepared = {}
+        if workers is None or workers > 1:
+            independent = [t for t in ordered_types if t in self.PARSERS and t not in self.CONTEXT_PARSERS]
+            try:
+                results = parse_batch(
+                    [(self.PARSERS[t], str(found_docs[t])) for t in independent],
+                    workers=workers,
+                    return_exceptions=True,
+                )
+                prepared = dict(zip(independent, results))
+            except Exception as e:
+                # Si el pool falla, el bucle ordenado los parsea en este proceso
+                print(f"   ⚠️ Parallel parsing failed ({e}), parsing sequentially")
+
         for doc_type in ordered_types:
             filepath = found_docs[doc_type]
             self.file_mapping[doc_type] = filepath
@@ -184,10 +210,15 @@ class MatrixGenerator:
             parser_class = self.PARSERS[doc_type]
 
             try:
-                parser = parser_class(str(filepath))
-                # Pasa el contexto de todos los datos parseados hasta ahora a TODOS los parsers
-                parser.context_data = dict(self.parsed_data)
-                data = parser.parse()
+                if doc_type in prepared:
+                    data = prepared[doc_type]
+                    if isinstance(data, Exception):
+                        raise data
+                else:
+                    parser = parser_class(str(filepath))
+                    # Pasa el contexto de todos los datos parseados hasta ahora
+                    parser.context_data = dict(self.parsed_data)
+                    data = parser.parse()
                 self.parsed_data[doc_type] = data
                 print(f"   ✓ Parsed {doc_type}")
             except Exception as e:
@@ -1 +1,64 @@
-# Parsers Package
\ No newline at end of file
+"""
+Document parsers + helper to parse many documents across CPU cores
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+
+def _parse_one(job: Tuple[Type, str]) -> Dict[str, Any]:
+    parser_class, path = job
+    return parser_class(str(path)).parse()
+
+
+def _parse_one_safe(job: Tuple[Type, str]) -> Any:
+    try:
+        return _parse_one(job)
+    except Exception as e:
+        # parser exceptions need not survive pickling back to the parent
+        # (e.g. a custom __init__ signature): send a plain, picklable one
+        return RuntimeError(f"{type(e).__name__}: {e}")
+
+
+def parse_batch(
+    jobs: Iterable[Tuple[Type, str]],
+    *,
+    workers: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Parse (parser_class, path) jobs in worker processes.
+
+    Each document is independent (text extraction + regex), so processes
+    sidestep the GIL. Results come back in the same order as `jobs`; a
+    parser exception is re-raised here, or returned in place of that job's
+    result when `return_exceptions` is set (as a RuntimeError carrying the
+    original type and message). `workers=1` (or a single job) parses in this
+    process without starting a pool.
+
+    If the pool itself breaks (a worker killed, e.g. out of memory, or a
+    result that cannot be pickled), the jobs without a result yet are parsed
+    again in this process, so one bad document never costs the others.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    fn = _parse_one_safe if return_exceptions else _parse_one
+    if workers == 1 or len(jobs) == 1:
+        return [fn(job) for job in jobs]
+    n_workers = workers or os.cpu_count() or 1
+    # a project folder is only a handful of documents: don't let one chunk
+    # swallow them all, but keep chunks for large batches
+    chunksize = max(1, min(8, len(jobs) // (4 * n_workers)))
+    results: List[Any] = []
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            for res in ex.map(fn, jobs, chunksize=chunksize):
+                results.append(res)
+    except (BrokenProcessPool, PicklingError) as e:
+        print(f"  ⚠️ Process pool failed ({type(e).__name__}: {e}), parsing the remaining documents in-process")
+        results.extend(fn(job) for job in jobs[len(results):])
+    return results
@@ -2,8 +2,10 @@
 Base parser with automatic OCR support for scanned PDFs and images
 """
 import re
+import unicodedata
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import os
 import shutil
 
@@ -24,6 +26,55 @@ def _configure_binaries():
 POPPLER_PATH = _configure_binaries()
 
 
+def _collapse_ws(s: str) -> str:
+    """Collapse runs of whitespace to single spaces and strip the ends."""
+    return " ".join(s.split())
+
+
+_DNI_LETTERS = "TRWAGMYFPDXBNJZSQVHLCKE"
+
+# _clean_text
+# NFKC would also fold º/ª/² into o/a/2, which several patterns match
+# literally (Nº, Pº, m²), so only compose accents and expand the few
+# compatibility characters pdfplumber/tesseract actually emit.
+_UNICODE_FIXES = (("\u00a0", " "), ("\ufb01", "fi"), ("\ufb02", "fl"))
+_RE_HSPACE = re.compile(r"[ \t]+")
+_RE_MANY_NL = re.compile(r"\n{3,}")
+_RE_LONE_LETTER = re.compile(r"[A-Za-zÁÉÍÓÚÑ]")
+
+
+# extract_text results (LRU), keyed by (resolved path, mtime_ns, size): PDF
+# decoding/OCR dominates parse time, and the same file may be handed to more
+# than one parser. Extraction also depends on the file name (OCR mode), which
+# is part of the path.
+_TEXT_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_TEXT_CACHE_SIZE = 64
+
+
+# OCR reads "ó" as "6" in these words (FichaParser/ContratoParser _normalize)
+_OCR_FIXES = (("Le6n", "León"), ("Direcci6n", "Dirección"), ("ubicaci6n", "ubicación"))
+
+
+def _fix_ocr_confusions(t: str) -> str:
+    """Undo the known OCR 6->ó misreads (cheap no-op when no "6n" is present)."""
+    if "6n" not in t:
+        return t
+    for bad, good in _OCR_FIXES:
+        t = t.replace(bad, good)
+    return t
+
+
+def _is_valid_spanish_dni(dni: str) -> bool:
+    """Checksum-validate a Spanish DNI (8 digits + control letter)."""
+    dni = (dni or "").strip().upper().replace(" ", "")
+    if len(dni) != 9:
+        return False
+    num_s, last = dni[:8], dni[8]
+    if not num_s.isdecimal() or not ("A" <= last <= "Z"):
+        return False
+    return last == _DNI_LETTERS[int(num_s) % 23]
+
+
 class BaseDocumentParser:
     """Base class for document parsers with automatic OCR fallback"""
 
@@ -101,6 +152,27 @@ class BaseDocumentParser:
         if self.text:
             return self.text
 
+        try:
+            st = self.file_path.stat()
+            key = (str(self.file_path.resolve()), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+
+        cached = _TEXT_CACHE.get(key) if key else None
+        if cached is not None:
+            _TEXT_CACHE.move_to_end(key)
+            self.text = cached
+            return self.text
+
+        self._extract_text_uncached()
+        # empty text may just mean OCR is unavailable right now: don't pin it
+        if key and self.text:
+            _TEXT_CACHE[key] = self.text
+            if len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+                _TEXT_CACHE.popitem(last=False)
+        return self.text
+
+    def _extract_text_uncached(self) -> str:
         ext = self.file_path.suffix.lower()
 
         # --- Images: OCR only ---
@@ -149,20 +221,30 @@ class BaseDocumentParser:
         return self.text
 
     def parse(self) -> dict:
+        """
+        Return the extracted fields as a plain dict.
+
+        Must depend only on the document and touch no shared state:
+        parsers.parse_batch runs it in worker processes and pickles the result.
+        """
         raise NotImplementedError("Subclasses must implement parse()")
 
     def _clean_text(self, text: str) -> str:
         if not text:
             return ""
-        text = re.sub(r"[ \t]+", " ", text)
+        text = unicodedata.normalize("NFC", text)
+        for bad, good in _UNICODE_FIXES:
+            if bad in text:
+                text = text.replace(bad, good)
+        text = _RE_HSPACE.sub(" ", text)
         lines = []
         for ln in text.splitlines():
             s = ln.strip()
-            if len(s) <= 2 and re.fullmatch(r"[A-Za-zÁÉÍÓÚÑ]", s or ""):
+            if len(s) <= 2 and _RE_LONE_LETTER.fullmatch(s):
                 continue
             lines.append(ln)
         text = "\n".join(lines)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _RE_MANY_NL.sub("\n\n", text)
         return text.strip()
 
     def _detect_isolation_type(self, text: str):
@@ -2,7 +2,7 @@
 Parser for CEE FINAL documents
 """
 
-from .base_parser import BaseDocumentParser
+from .base_parser import BaseDocumentParser, _collapse_ws
 from typing import Dict, Any
 import re
 
@@ -45,7 +45,7 @@ class CeeParser(BaseDocumentParser):
             if match:
                 addr = match.group(1).strip()
                 # Limpia saltos de línea
-                addr = re.sub(r'\s+', ' ', addr)
+                addr = _collapse_ws(addr)
                 if len(addr) >= 10:
                     return addr
         
@@ -58,7 +58,7 @@ class CeeParser(BaseDocumentParser):
         match = re.search(pattern, self.text, re.IGNORECASE)
         if match:
             catastral = match.group(1).strip()
-            catastral = re.sub(r'\s+', '', catastral)  # quita espacios
+            catastral = "".join(catastral.split())  # quita espacios
             if re.match(r'^[0-9]+[A-Z]+[0-9]+[A-Z]+[0-9]+[A-Z]+$', catastral):
                 return catastral
         
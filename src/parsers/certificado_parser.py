@@ -2,7 +2,7 @@
 Parser for CERTIFICADO INSTALADOR documents
 """
 
-from .base_parser import BaseDocumentParser
+from .base_parser import BaseDocumentParser, _collapse_ws
 from typing import Dict, Any
 import re
 
@@ -136,7 +136,7 @@ class CertificadoParser(BaseDocumentParser):
         match = re.search(pattern, self.text, re.IGNORECASE)
         if match:
             address = match.group(1).strip()
-            address = re.sub(r"\s+", " ", address)
+            address = _collapse_ws(address)
             return address
         return "NOT FOUND"
 
@@ -146,7 +146,7 @@ class CertificadoParser(BaseDocumentParser):
         match = re.search(pattern, self.text, re.IGNORECASE)
         if match:
             catastral = match.group(1).strip()
-            catastral = re.sub(r"\s+", "", catastral)
+            catastral = "".join(catastral.split())
             if re.match(r"^[0-9]+[A-Z]+[0-9]+[A-Z]+[0-9]+[A-Z]+$", catastral):
                 return catastral
         return "NOT FOUND"
@@ -13,26 +13,248 @@ Returns fields used in MatrixGenerator:
 - installer/location/utm/catastral/energy_savings/act_code
 """
 
-from .base_parser import BaseDocumentParser
-from typing import Dict, Any, Tuple
+from .base_parser import (
+    BaseDocumentParser, _DNI_LETTERS, _collapse_ws, _fix_ocr_confusions, _is_valid_spanish_dni,
+)
+from typing import Dict, Any, Optional, Tuple
 import re
 
 
+_FLAGS = re.IGNORECASE | re.DOTALL
+
+# Normalization
+_RE_HSPACE = re.compile(r"[ \t]+")
+_RE_MANY_NL = re.compile(r"\n{3,}")
+_RE_NONDIGIT = re.compile(r"[^\d]")
+
+# DNI / CIF / NIE
+_RE_DNI_OCR = re.compile(r"([0-9OIL]{8})([A-Z6IL1])")
+_RE_DNI_CLEAN = re.compile(r"(\d{8}[A-Z])")
+_RE_CIF = re.compile(r"\b([A-Z]\d{8})\b")
+
+# Sections
+# The leading \b of these anchors is checked by hand in _word_start(): with it,
+# re cannot use its literal-prefix scan and steps through every character.
+# The *_UP variants run case-sensitively on the uppercased text (see parse()).
+_RE_DE_UNA_PARTE = re.compile(r"DE\s+UNA\s+PARTE\b", re.IGNORECASE)
+_RE_DE_UNA_PARTE_UP = re.compile(r"DE\s+UNA\s+PARTE\b")
+_RE_DE_OTRA = re.compile(r"DE\s+OTRA\b", re.IGNORECASE)  # tail of \bY\s+DE\s+OTRA\b
+_RE_DE_OTRA_UP = re.compile(r"DE\s+OTRA\b")
+_RE_CESIONARIO = re.compile(r"CESIONARIO\b", re.IGNORECASE)
+_RE_CESIONARIO_UP = re.compile(r"CESIONARIO\b")
+_RE_CEDENTE = re.compile(r"CEDENTE\b", re.IGNORECASE)
+_RE_CEDENTE_UP = re.compile(r"CEDENTE\b")
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _word_start(pattern: re.Pattern, t: str) -> int:
+    """Start of the first `pattern` match that also satisfies a leading \\b, or -1."""
+    for m in pattern.finditer(t):
+        i = m.start()
+        if i == 0 or not _is_word_char(t[i - 1]):
+            return i
+    return -1
+
+
+def _find_y_de_otra(t: str, pattern: re.Pattern = _RE_DE_OTRA) -> int:
+    """Start of the first \\bY\\s+DE\\s+OTRA\\b (any case) in `t`, or -1."""
+    for m in pattern.finditer(t):
+        j = i = m.start()
+        while j > 0 and t[j - 1].isspace():
+            j -= 1
+        if j == i or j == 0:
+            continue
+        y = j - 1
+        if t[y] in "Yy" and (y == 0 or not _is_word_char(t[y - 1])):
+            return y
+    return -1
+
+
+# ACT / common
+_RE_ACT_CODE = re.compile(r"(RES0*\d{2,3})", re.IGNORECASE)
+_RE_ACT_ZEROS = re.compile(r"RES0+(\d)")
+_RE_ENERGY = re.compile(r"(\d[\d\s.,]{2,})\s*k[wW]?[hH]\s*/\s*a(?:ñ|n)o", re.IGNORECASE)
+_RE_CATASTRAL_A = re.compile(r"Referencia\s+catastral\s*:\s*([0-9A-Z\s]+)", re.IGNORECASE)
+_RE_CATASTRAL_OK = re.compile(r"^[0-9A-Z]{10,25}$")
+_RE_CATASTRAL_B = re.compile(r"\b(\d{6,8}[A-Z]{1,3}\d{2,6}[A-Z]{1,4}\d{1,6}[A-Z]{1,4})\b")
+_RE_UTM_A = re.compile(r"UTM\s+(\d+),?\s*X:\s*([\d.]+),?\s*Y:\s*([\d.\s]+)", re.IGNORECASE)
+_RE_UTM_B = re.compile(r"X:\s*([\d.]+)[^Y]*Y:\s*([\d.]+)", re.IGNORECASE)
+_RE_HUSO = re.compile(r"HUSO[:\s]*(\d+)", re.IGNORECASE)
+_RE_INSTALLER = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"Instalador[:\s]+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s&\.-]{3,80})",
+        r"El\s+Instalador[:\s]+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s&\.-]{3,80})",
+    )
+)
+_RE_INSTALLER_TAIL = re.compile(r"\b(NIF|CIF)\b.*$", re.IGNORECASE)
+_RE_LOCATION_DIR = re.compile(r"Direcci[oó]n\s*:\s*([^\n\.]{8,220})", re.IGNORECASE)
+_RE_LOCATION_EN = re.compile(
+    r"\ben\s+(.{8,200}?(?:PLAZA|CALLE|AVENIDA|CARRETERA|CL)\b.{0,80}?(?:\b\d{5}\b|Castilla y Le[oó]n))",
+    re.IGNORECASE,
+)
+_RE_LOCATION_LOCALIDAD = re.compile(r"localidad\s+de\s+(.{3,80}?)(?:\s+Castilla y Le[oó]n|\s+\b\d{5}\b)", re.IGNORECASE)
+
+# Cesionario (empresa)
+_RE_CESIONARIO_COMPANY = re.compile(r"Y\s+de\s+otra\s+parte,?\s*([A-Z0-9ÑÁÉÍÓÚ\.\s,]{3,80}?),\s*con\s+CIF", _FLAGS)
+_RE_CESIONARIO_COMPANY_A = re.compile(r"DE\s+UNA\s+PARTE[,\s]+(.+?)(?:,?\s*con\s+(?:CIF|NIF)|\s+(?:CIF|NIF)\b)", _FLAGS)
+_RE_CESIONARIO_COMPANY_B = re.compile(r"\bCESIONARIO\b\s*[:\-]?\s*(.+?)(?:\s+(?:CIF|NIF)\b|,|\n)", _FLAGS)
+_RE_CESIONARIO_CIF = re.compile(r"\bCIF\s*([A-Z]\d{8})\b", re.IGNORECASE)
+_RE_CESIONARIO_ADDRESS = re.compile(r"domicilio\s+social\s+en\s+(.{10,220}?)(?:;|,?\s*debidamente|\n\s*debidamente)", _FLAGS)
+_RE_CESIONARIO_ADDRESS_OLD = re.compile(r"domicilio[^:]*:\s*(.+?)(?:\n|,?\s*CP|\s+C\.P\.)", _FLAGS)
+_RE_REPRESENTATIVE = re.compile(r"representada\s+por\s+D\.\s*([A-ZÑÁÉÍÓÚ][A-Za-zÑÁÉÍÓÚ\s]{5,80}?)\s*,\s*mayor\s+de\s+edad", _FLAGS)
+_RE_REPRESENTATIVE_OLD = re.compile(r"representad[oa]\s+por\s+D[./]?\s*([A-ZÑÁÉÍÓÚ][A-Za-zÑÁÉÍÓÚ\s]{5,60}?)(?:,|\s+con|\n)", _FLAGS)
+_RE_NIE = re.compile(r"\bNIE\s*([A-Z]\s*\d[\d\s\-]{5,}\s*[A-Z])\b", re.IGNORECASE)
+_RE_SIGNATURE = re.compile(r"Firma|Firmado|Fdo\.", re.IGNORECASE)
+_RE_SIGNATURE_UP = re.compile(r"FIRMA|FIRMADO|FDO\.")
+
+# Cedente (homeowner)
+_RE_CEDENTE_DNI_DIRECT = re.compile(r"De\s+una\s+parte.*?\bDNI\s*([0-9OIlL]{8}\s*[A-Z6IL1])", _FLAGS)
+_RE_CEDENTE_DNI_MAYOR = re.compile(r"mayor\s+de\s+edad,\s*con\s+DNI[:\s]*([0-9OIlL]{8}\s*[A-Z6IL1])", _FLAGS)
+_RE_CEDENTE_DNI_LABEL = re.compile(r"\bDNI[:\s]*([0-9OIlL]{8}\s*[A-Z6IL1])\b", re.IGNORECASE)
+_RE_CEDENTE_ADDRESS = re.compile(r"domicilio\s+en\s+(.{10,140}?)(?:,?\s*tel[eé]fono|\s+tel[eé]fono|\n)", _FLAGS)
+_RE_PHONE_LABEL = re.compile(r"tel[eé]fono[^+\d]*([+\d][\d\s-]{8,})", re.IGNORECASE)
+_RE_EMAIL = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+_RE_NOTIFICATIONS = re.compile(r"[Nn]otificaciones[:\s]+(.+?)(?:\n|$)", re.IGNORECASE)
+
+# Spanish phone: 9 digits starting with 6-9, optional +34 prefix
+_RE_PHONE = re.compile(r"\b(\+34)?\s*([6-9]\d{8})\b")
+
+# Words that mean a cedente "name" capture actually ran into template text
+_CEDENTE_BAD = re.compile(
+    r"\b(segundo apellido|haya|debido|cantidad|instalador|por\s+cuanto|notificaciones|cl[aá]usula|presente|bono|social|perceptores)\b",
+    re.IGNORECASE,
+)
+_CEDENTE_NAME_DIRECT = re.compile(
+    r"De\s+una\s+parte,?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,80}?)\s*,\s*mayor\s+de\s+edad,\s*con\s+DNI",
+    _FLAGS,
+)
+# Tried in order; the first capture that looks like a name wins
+_CEDENTE_NAME_PATTERNS = tuple(
+    re.compile(p, _FLAGS)
+    for p in (
+        r"Y\s+DE\s+OTRA\s+PARTE[:,\s]*D\.?\s*(?:ÑA|NA|N)?\.?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,60}?)\s*,\s*mayor\s+de\s+edad",
+        r"CEDENTE[:\s]*D\.?\s*(?:ÑA|NA|N)?\.?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,60}?)\s*,\s*mayor\s+de\s+edad",
+        r"D\.?\s*(?:ÑA|NA|N)?\.?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,60}?)\s*,\s*mayor\s+de\s+edad,\s*con\s+DNI",
+    )
+)
+
+# Contract terms
+# (anchor, pattern): the pattern can only match if the _ANCHOR_WORDS entry is present
+_RE_SELL_PRICE = tuple(
+    (anchor, re.compile(p, re.IGNORECASE))
+    for anchor, p in (
+        ("€", r"contraprestación\s+en\s+especie\s+se\s+estima\s+en\s+un\s+valor\s+económico\s+equivalente\s+de\s+([\d\s,]+(?:\.\d+)?)\s*€"),
+        ("€/", r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh"),
+        ("€/", r"venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh"),
+        ("€/", r"([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh"),
+        ("EURO", r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*euros?\s*por\s*[kI]Wh"),
+    )
+)
+_RE_START_DATE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"inici[oó]\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
+        r"[Ff]echa.*?inicio[:\s]+([\d/]+)",
+        r"desde\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
+        r"fecha\s+de\s+inicio[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+        r"vigencia\s+desde[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+        r"contrato\s+desde[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+    )
+)
+_RE_FINISH_DATE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"finaliz[oó].*?el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
+        r"[Ff]echa.*?fin[:\s]+([\d/]+)",
+        r"hasta\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
+        r"fecha\s+de\s+fin[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+        r"vigencia\s+hasta[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+        r"contrato\s+hasta[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+    )
+)
+_RE_LIFESPAN = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"duración.*?(\d+)\s*años?",
+        r"(\d+)\s*años?",
+        r"período.*?(\d+)\s*años?",
+        r"vigencia.*?(\d+)\s*años?",
+        r"10",  # common default
+    )
+)
+
+# A page needs one of these (uppercased) to be read as a cesión de ahorros
+# contract; CESI6N is the usual OCR misread of CESIÓN
+_CONTRACT_MARKERS = ("CESION", "CESIÓN", "CESI6N", "CEDENTE", "RES0")
+
+# Literal anchors some extractors require before their regex can match.
+# parse() checks them all once against the uppercased text, so an extractor
+# can bail out without running its regex when its anchor is missing.
+_ANCHOR_WORDS = (
+    "UTM", "X:", "REFERENCIA", "INSTALADOR", "DIRECCI", "LOCALIDAD",
+    "CIF", "NIE", "FIRMA", "FDO.", "NOTIFICACIONES", "TEL", "@",
+    "UNA", "OTRA", "CESIONARIO", "CEDENTE", "RES", "/", "€", "€/", "EURO",
+    "DNI", "INICI", "DESDE", "FIN", "HASTA",
+)
+
+# Result keys (document_type aside), in output order
+_RESULT_FIELDS = (
+    "sd_do_company_name", "sd_do_cif", "sd_do_address",
+    "sd_do_representative_name", "sd_do_representative_dni", "sd_do_signature",
+    "homeowner_name", "homeowner_dni", "homeowner_address", "homeowner_phone",
+    "homeowner_email", "homeowner_notifications", "homeowner_signatures",
+    "installer", "location", "catastral_ref", "utm_coordinates", "energy_savings",
+    "act_code", "sell_price", "start_date", "finish_date", "lifespan",
+)
+
+
 class ContratoParser(BaseDocumentParser):
     """Parser for Contrato Cesión Ahorros"""
 
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        # Per-document state, filled in by parse() before any extractor runs
+        self._text_norm = ""
+        self._text_upper: Optional[str] = None
+        self._cesionario_txt = ""
+        self._cedente_txt = ""
+        self._anchors: Optional[set] = None
+        self._sig_count: Optional[int] = None
+        self._cached_location: Optional[str] = None
+
     def parse(self) -> Dict[str, Any]:
         self.extract_text()
         t = self._normalize(self.text)
-
-        cesionario_txt, cedente_txt = self._split_sections(t)
+        if not t:
+            # blank page / failed OCR: every extractor would come back empty
+            return self._empty_result()
+        up = t.upper()
+        if not any(m in up for m in _CONTRACT_MARKERS):
+            # not a cesión de ahorros contract (misfiled / unrelated page)
+            print(f"  ⚠️ No cesión de ahorros markers in {self.file_path.name}, skipping contract fields.")
+            return self._empty_result()
+        self._anchors = {w for w in _ANCHOR_WORDS if w in up}
+        # Case-sensitive scans on `up` skip re.IGNORECASE's per-char folding.
+        # Only valid when upper() mapped every char 1:1 (no ß -> SS, ligatures...),
+        # so that offsets in `up` are offsets in `t`.
+        self._text_upper = up if len(up) == len(t) else None
+
+        cesionario_txt, cedente_txt = self._split_sections(t, self._text_upper)
         self._cesionario_txt = cesionario_txt
         self._cedente_txt = cedente_txt
         self._text_norm = t
+        self._sig_count = None
+        self._cached_location = None
 
         location = self._extract_location()
+        self._cached_location = location
+        homeowner_address = self._extract_cedente_address()
         if location == "NOT FOUND":
-            location = self._extract_cedente_address()
+            location = homeowner_address
 
         result = {
             "document_type": "CONTRATO",
@@ -48,7 +270,7 @@ class ContratoParser(BaseDocumentParser):
             # Cedente (homeowner)
             "homeowner_name": self._extract_cedente_name(),
             "homeowner_dni": self._extract_cedente_dni(),
-            "homeowner_address": self._extract_cedente_address(),
+            "homeowner_address": homeowner_address,
             "homeowner_phone": self._extract_cedente_phone(),
             "homeowner_email": self._extract_cedente_email(),
             "homeowner_notifications": self._extract_notifications(),
@@ -74,6 +296,9 @@ class ContratoParser(BaseDocumentParser):
     # Normalization & helpers
     # ------------------------
 
+    def _empty_result(self) -> Dict[str, Any]:
+        return {"document_type": "CONTRATO", **{k: "NOT FOUND" for k in _RESULT_FIELDS}}
+
     def _normalize(self, t: str) -> str:
         if not t:
             return ""
@@ -85,11 +310,10 @@ class ContratoParser(BaseDocumentParser):
             .replace("″", "''")
         )
 
-        # OCR rare encodings (safe minimal)
-        t = t.replace("Le6n", "León").replace("Direcci6n", "Dirección").replace("ubicaci6n", "ubicación")
+        t = _fix_ocr_confusions(t)
 
-        t = re.sub(r"[ \t]+", " ", t)
-        t = re.sub(r"\n{3,}", "\n\n", t)
+        t = _RE_HSPACE.sub(" ", t)
+        t = _RE_MANY_NL.sub("\n\n", t)
         return t.strip()
 
     def _is_valid_text(self, s: str, min_len: int = 8) -> bool:
@@ -104,11 +328,16 @@ class ContratoParser(BaseDocumentParser):
             return False
         return True
 
-    def _find_first(self, pattern: str, txt: str, flags=re.IGNORECASE | re.DOTALL) -> str:
-        m = re.search(pattern, txt or "", flags)
+    def _has_anchor(self, word: str) -> bool:
+        """False only when parse() already saw that `word` is absent from the text."""
+        anchors = self._anchors
+        return anchors is None or word in anchors
+
+    def _find_first(self, pattern: re.Pattern, txt: str) -> str:
+        m = pattern.search(txt or "")
         if not m:
             return "NOT FOUND"
-        val = re.sub(r"\s+", " ", m.group(1)).strip()
+        val = _collapse_ws(m.group(1))
         return val if self._is_valid_text(val, 3) else "NOT FOUND"
 
     def _find_dni(self, txt: str) -> str:
@@ -119,7 +348,7 @@ class ContratoParser(BaseDocumentParser):
         t = t.replace(" ", "").replace("-", "").replace(".", "").replace(":", "")
 
         # Buscar candidatos incluso embebidos en tokens (IDESP...13103004L)
-        for m in re.finditer(r"([0-9OIL]{8})([A-Z6IL1])", t):
+        for m in _RE_DNI_OCR.finditer(t):
             raw_num, raw_last = m.groups()
 
             # Normaliza SOLO los 8 "dígitos"
@@ -127,21 +356,21 @@ class ContratoParser(BaseDocumentParser):
 
             # La letra final se conserva; sólo tratamos casos OCR típicos
             if raw_last == "6":
-                last_candidates = ["G"]
-            elif raw_last in {"1", "I", "L"}:
+                last_candidates = "G"
+            elif raw_last in "1IL":
                 # OCR puede confundir I/L con 1 en la última letra
-                last_candidates = ["I", "L"]
+                last_candidates = "IL"
             else:
-                last_candidates = [raw_last]
+                last_candidates = raw_last
 
-            for last in last_candidates:
-                cand = f"{num}{last}"
-                if self._is_valid_spanish_dni(cand):
-                    return cand
+            # num es siempre de 8 dígitos: basta con comparar la letra de control
+            expected = _DNI_LETTERS[int(num) % 23]
+            if expected in last_candidates:
+                return f"{num}{expected}"
 
         # Fallback: si hay uno limpio directo
-        m = re.search(r"(\d{8}[A-Z])", t)
-        if m and self._is_valid_spanish_dni(m.group(1)):
+        m = _RE_DNI_CLEAN.search(t)
+        if m and _is_valid_spanish_dni(m.group(1)):
             return m.group(1)
 
         return "NOT FOUND"
@@ -150,16 +379,16 @@ class ContratoParser(BaseDocumentParser):
     def _find_cif(self, txt: str) -> str:
         if not txt:
             return "NOT FOUND"
-        m = re.search(r"\b([A-Z]\d{8})\b", txt.upper())
+        m = _RE_CIF.search(txt.upper())
         return m.group(1) if m else "NOT FOUND"
 
     def _normalize_nie(self, nie: str) -> str:
         if not nie:
             return "NOT FOUND"
-        nie = re.sub(r"[\s\-]", "", nie).upper()
+        nie = "".join(nie.split()).replace("-", "").upper()
         return nie
 
-    def _split_sections(self, t: str) -> Tuple[str, str]:
+    def _split_sections(self, t: str, up: Optional[str] = None) -> Tuple[str, str]:
         """
         Returns (cesionario_text, cedente_text)
 
@@ -172,19 +401,25 @@ class ContratoParser(BaseDocumentParser):
             return "", ""
 
         # ✅ Template A: DE UNA PARTE / Y DE OTRA PARTE
-        m1 = re.search(r"\bDE\s+UNA\s+PARTE\b", t, re.IGNORECASE)
-        m2 = re.search(r"\bY\s+DE\s+OTRA\s+PARTE\b|\bY\s+DE\s+OTRA\b", t, re.IGNORECASE)
-
-        if m1 and m2 and m2.start() > m1.start():
-            cedente = t[m1.start():m2.start()]
-            cesionario = t[m2.start():]
+        # (skip the full-text scans when the anchor words are not in the text)
+        if up:
+            s, de_una, de_otra, cesionario_re, cedente_re = up, _RE_DE_UNA_PARTE_UP, _RE_DE_OTRA_UP, _RE_CESIONARIO_UP, _RE_CEDENTE_UP
+        else:
+            s, de_una, de_otra, cesionario_re, cedente_re = t, _RE_DE_UNA_PARTE, _RE_DE_OTRA, _RE_CESIONARIO, _RE_CEDENTE
+
+        i1 = _word_start(de_una, s) if self._has_anchor("UNA") and self._has_anchor("OTRA") else -1
+        i2 = _find_y_de_otra(s, de_otra) if i1 >= 0 else -1
+
+        if i1 >= 0 and i2 > i1:
+            cedente = t[i1:i2]
+            cesionario = t[i2:]
             return cesionario, cedente
 
         # Template B: CESIONARIO / CEDENTE
-        m3 = re.search(r"\bCESIONARIO\b", t, re.IGNORECASE)
-        m4 = re.search(r"\bCEDENTE\b", t, re.IGNORECASE)
-        if m3 and m4 and m4.start() > m3.start():
-            return t[m3.start():m4.start()], t[m4.start():]
+        i3 = _word_start(cesionario_re, s) if self._has_anchor("CESIONARIO") and self._has_anchor("CEDENTE") else -1
+        i4 = _word_start(cedente_re, s) if i3 >= 0 else -1
+        if i3 >= 0 and i4 > i3:
+            return t[i3:i4], t[i4:]
 
         return "", t
 
@@ -193,11 +428,13 @@ class ContratoParser(BaseDocumentParser):
     # ------------------------
 
     def _extract_act_code(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
-        m = re.search(r"(RES0*\d{2,3})", t, re.IGNORECASE)
+        if not self._has_anchor("RES"):
+            return "NOT FOUND"
+        t = self._text_norm or self.text
+        m = _RE_ACT_CODE.search(t)
         if m:
             code = m.group(1).upper()
-            code = re.sub(r"RES0+(\d)", r"RES0\1", code)
+            code = _RE_ACT_ZEROS.sub(r"RES0\1", code)
             return code
         return "NOT FOUND"
 
@@ -205,13 +442,15 @@ class ContratoParser(BaseDocumentParser):
         """
         Must handle: "9 180 kWh/año"
         """
-        t = getattr(self, "_text_norm", "") or self.text
+        if not self._has_anchor("/"):
+            return "NOT FOUND"
+        t = self._text_norm or self.text
 
-        m = re.search(r"(\d[\d\s.,]{2,})\s*k[wW]?[hH]\s*/\s*a(?:ñ|n)o", t, re.IGNORECASE)
+        m = _RE_ENERGY.search(t)
         if m:
             raw = m.group(1)
             # ✅ deja solo dígitos (mata espacios, puntos, comas y saltos)
-            value = re.sub(r"[^\d]", "", raw)
+            value = _RE_NONDIGIT.sub("", raw)
 
             if not value:
                 return "NOT FOUND"
@@ -229,77 +468,76 @@ class ContratoParser(BaseDocumentParser):
         return "NOT FOUND"
 
     def _extract_catastral_ref(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
+        t = self._text_norm or self.text
 
-        m = re.search(r"Referencia\s+catastral\s*:\s*([0-9A-Z\s]+)", t, re.IGNORECASE)
+        m = self._has_anchor("REFERENCIA") and _RE_CATASTRAL_A.search(t)
         if m:
-            ref = re.sub(r"\s+", "", m.group(1)).strip()
-            if re.match(r"^[0-9A-Z]{10,25}$", ref):
+            ref = "".join(m.group(1).split())
+            if _RE_CATASTRAL_OK.match(ref):
                 return ref
 
-        m = re.search(r"\b(\d{6,8}[A-Z]{1,3}\d{2,6}[A-Z]{1,4}\d{1,6}[A-Z]{1,4})\b", t)
+        m = _RE_CATASTRAL_B.search(t)
         if m:
             return m.group(1)
 
         return "NOT FOUND"
 
     def _extract_utm_coordinates(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
+        t = self._text_norm or self.text
+        # both patterns start with a literal: jump straight to its first
+        # occurrence instead of running the case-insensitive scan from 0
+        up = self._text_upper if t is self._text_norm else None
 
-        m = re.search(r"UTM\s+(\d+),?\s*X:\s*([\d.]+),?\s*Y:\s*([\d.\s]+)", t, re.IGNORECASE)
+        m = self._has_anchor("UTM") and _RE_UTM_A.search(t, up.find("UTM") if up else 0)
         if m:
             zone = m.group(1)
             x = m.group(2)
             y = m.group(3).replace(" ", "")
             return f"X:{x} Y:{y} HUSO:{zone}"
 
-        m = re.search(r"X:\s*([\d.]+)[^Y]*Y:\s*([\d.]+)", t, re.IGNORECASE)
+        m = self._has_anchor("X:") and _RE_UTM_B.search(t, up.find("X:") if up else 0)
         if m:
             x = m.group(1)
             y = m.group(2)
-            zm = re.search(r"HUSO[:\s]*(\d+)", t, re.IGNORECASE)
+            zm = _RE_HUSO.search(t)
             zone = zm.group(1) if zm else "30"
             return f"X:{x} Y:{y} HUSO:{zone}"
 
         return "NOT FOUND"
 
     def _extract_installer(self) -> str:
-        txt = self._normalize(self.text)
-        patterns = [
-            r"Instalador[:\s]+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s&\.-]{3,80})",
-            r"El\s+Instalador[:\s]+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s&\.-]{3,80})",
-        ]
-        for p in patterns:
-            m = re.search(p, txt, re.IGNORECASE)
-            if m:
-                name = re.sub(r"\s+", " ", m.group(1)).strip()
-                name = re.sub(r"\b(NIF|CIF)\b.*$", "", name, flags=re.IGNORECASE).strip()
-                if len(name.split()) >= 2:
-                    return name
+        if not self._has_anchor("INSTALADOR"):
+            return "NOT FOUND"
+        txt = self._text_norm or self.text
+        for p in _RE_INSTALLER:
+            m = p.search(txt)
+            if not m:
+                # "El Instalador ..." can only match where "Instalador ..." does
+                break
+            name = _collapse_ws(m.group(1))
+            name = _RE_INSTALLER_TAIL.sub("", name).strip()
+            if len(name.split()) >= 2:
+                return name
         return "NOT FOUND"
 
     def _extract_location(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
+        t = self._text_norm or self.text
 
-        m = re.search(r"Direcci[oó]n\s*:\s*([^\n\.]{8,220})", t, re.IGNORECASE)
+        m = self._has_anchor("DIRECCI") and _RE_LOCATION_DIR.search(t)
         if m:
-            loc = re.sub(r"\s+", " ", m.group(1)).strip().rstrip(".")
+            loc = _collapse_ws(m.group(1)).rstrip(".")
             if self._is_valid_text(loc, 8):
                 return loc
 
-        m = re.search(
-            r"\ben\s+(.{8,200}?(?:PLAZA|CALLE|AVENIDA|CARRETERA|CL)\b.{0,80}?(?:\b\d{5}\b|Castilla y Le[oó]n))",
-            t,
-            re.IGNORECASE,
-        )
+        m = _RE_LOCATION_EN.search(t)
         if m:
-            loc = re.sub(r"\s+", " ", m.group(1)).strip()
+            loc = _collapse_ws(m.group(1))
             if self._is_valid_text(loc, 8):
                 return loc
 
-        m = re.search(r"localidad\s+de\s+(.{3,80}?)(?:\s+Castilla y Le[oó]n|\s+\b\d{5}\b)", t, re.IGNORECASE)
+        m = self._has_anchor("LOCALIDAD") and _RE_LOCATION_LOCALIDAD.search(t)
         if m:
-            loc = re.sub(r"\s+", " ", m.group(1)).strip()
+            loc = _collapse_ws(m.group(1))
             if self._is_valid_text(loc, 8):
                 return loc
 
@@ -311,106 +549,100 @@ class ContratoParser(BaseDocumentParser):
 
     def _extract_cesionario_company(self) -> str:
         # ✅ extractor directo (para tu formato real)
-        t = getattr(self, "_text_norm", "") or self.text
-        m = re.search(
-            r"Y\s+de\s+otra\s+parte,?\s*([A-Z0-9ÑÁÉÍÓÚ\.\s,]{3,80}?),\s*con\s+CIF",
-            t,
-            re.IGNORECASE | re.DOTALL,
-        )
+        t = self._text_norm or self.text
+        m = _RE_CESIONARIO_COMPANY.search(t)
         if m:
-            val = re.sub(r"\s+", " ", m.group(1)).strip()
+            val = _collapse_ws(m.group(1))
             if self._is_valid_text(val, 3):
                 return val
 
         # fallback a secciones
-        txt = getattr(self, "_cesionario_txt", "") or ""
+        txt = self._cesionario_txt
         t2 = txt if txt else t
 
-        val = self._find_first(
-            r"DE\s+UNA\s+PARTE[,\s]+(.+?)(?:,?\s*con\s+(?:CIF|NIF)|\s+(?:CIF|NIF)\b)",
-            t2
-        )
+        val = self._find_first(_RE_CESIONARIO_COMPANY_A, t2)
         if val != "NOT FOUND":
             return val
 
-        val = self._find_first(r"\bCESIONARIO\b\s*[:\-]?\s*(.+?)(?:\s+(?:CIF|NIF)\b|,|\n)", t2)
+        val = self._find_first(_RE_CESIONARIO_COMPANY_B, t2)
         if val != "NOT FOUND":
             return val
 
         return "NOT FOUND"
 
     def _extract_cesionario_cif(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
-        m = re.search(r"\bCIF\s*([A-Z]\d{8})\b", t, re.IGNORECASE)
+        t = self._text_norm or self.text
+        m = self._has_anchor("CIF") and _RE_CESIONARIO_CIF.search(t)
         if m:
             return m.group(1).upper()
 
-        txt = getattr(self, "_cesionario_txt", "") or ""
+        txt = self._cesionario_txt
         t2 = txt if txt else t
         return self._find_cif(t2)
 
     def _extract_cesionario_address(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
+        t = self._text_norm or self.text
 
         # ✅ Captura completo aunque haya salto de línea: "Conde de Aranda\n1, 29..."
-        m = re.search(
-            r"domicilio\s+social\s+en\s+(.{10,220}?)(?:;|,?\s*debidamente|\n\s*debidamente)",
-            t,
-            re.IGNORECASE | re.DOTALL,
-        )
+        m = _RE_CESIONARIO_ADDRESS.search(t)
         if m:
-            val = re.sub(r"\s+", " ", m.group(1)).strip().rstrip(",;.")
+            val = _collapse_ws(m.group(1)).rstrip(",;.")
             return val if self._is_valid_text(val, 8) else "NOT FOUND"
 
         # fallback antiguo (por si otro template)
-        txt = getattr(self, "_cesionario_txt", "") or ""
+        txt = self._cesionario_txt
         t2 = txt if txt else t
-        val = self._find_first(r"domicilio[^:]*:\s*(.+?)(?:\n|,?\s*CP|\s+C\.P\.)", t2)
+        val = self._find_first(_RE_CESIONARIO_ADDRESS_OLD, t2)
         return val if self._is_valid_text(val, 8) else "NOT FOUND"
 
 
     def _extract_cesionario_representative(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
+        t = self._text_norm or self.text
 
         # ✅ extractor directo
-        m = re.search(
-            r"representada\s+por\s+D\.\s*([A-ZÑÁÉÍÓÚ][A-Za-zÑÁÉÍÓÚ\s]{5,80}?)\s*,\s*mayor\s+de\s+edad",
-            t,
-            re.IGNORECASE | re.DOTALL,
-        )
+        m = _RE_REPRESENTATIVE.search(t)
         if m:
-            val = re.sub(r"\s+", " ", m.group(1)).strip()
+            val = _collapse_ws(m.group(1))
             return val if self._is_valid_text(val, 5) else "NOT FOUND"
 
         # fallback
-        txt = getattr(self, "_cesionario_txt", "") or ""
+        txt = self._cesionario_txt
         t2 = txt if txt else t
-        val = self._find_first(
-            r"representad[oa]\s+por\s+D[./]?\s*([A-ZÑÁÉÍÓÚ][A-Za-zÑÁÉÍÓÚ\s]{5,60}?)(?:,|\s+con|\n)",
-            t2,
-        )
+        val = self._find_first(_RE_REPRESENTATIVE_OLD, t2)
         return val
 
     def _extract_cesionario_dni(self) -> str:
         """
         In your real docs it's NIE: 'con NIE Z161 6694-Y'
         """
-        t = getattr(self, "_text_norm", "") or self.text
+        t = self._text_norm or self.text
 
-        m = re.search(r"\bNIE\s*([A-Z]\s*\d[\d\s\-]{5,}\s*[A-Z])\b", t, re.IGNORECASE)
+        m = self._has_anchor("NIE") and _RE_NIE.search(t)
         if m:
             return self._normalize_nie(m.group(1))
 
         # fallback (might return DNI format)
-        txt = getattr(self, "_cesionario_txt", "") or ""
+        txt = self._cesionario_txt
         t2 = txt if txt else t
         return self._find_dni(t2)
 
+    def _signature_count(self) -> int:
+        """Firma/Firmado/Fdo. occurrences in the text, counted once per parse()."""
+        n = self._sig_count
+        if n is None:
+            n = 0
+            if self._has_anchor("FIRMA") or self._has_anchor("FDO."):
+                up = self._text_upper
+                if up:
+                    n = len(_RE_SIGNATURE_UP.findall(up))
+                else:
+                    t = self._text_norm or self.text
+                    n = len(_RE_SIGNATURE.findall(t))
+            self._sig_count = n
+        return n
+
     def _check_cesionario_signature(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
-        if re.search(r"Firma|Firmado|Fdo\.", t, re.IGNORECASE):
-            return "Present"
-        return "NOT FOUND"
+        return "Present" if self._signature_count() > 0 else "NOT FOUND"
 
 
     # ------------------------
@@ -418,36 +650,20 @@ class ContratoParser(BaseDocumentParser):
     # ------------------------
 
     def _extract_cedente_name(self) -> str:
-        txt = getattr(self, "_cedente_txt", "") or self.text
-        txt = self._normalize(txt)
-
-        bad_words = re.compile(
-            r"\b(segundo apellido|haya|debido|cantidad|instalador|por\s+cuanto|notificaciones|cl[aá]usula|presente|bono|social|perceptores)\b",
-            re.IGNORECASE,
-        )
+        txt = self._cedente_txt or self.text
 
         # ✅ extractor directo “De una parte, <NOMBRE>, mayor de edad, con DNI”
-        m = re.search(
-            r"De\s+una\s+parte,?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,80}?)\s*,\s*mayor\s+de\s+edad,\s*con\s+DNI",
-            txt,
-            re.IGNORECASE | re.DOTALL,
-        )
+        m = _CEDENTE_NAME_DIRECT.search(txt)
         if m:
-            name = re.sub(r"\s+", " ", m.group(1)).strip()
-            if 2 <= len(name.split()) <= 6 and not bad_words.search(name):
+            name = _collapse_ws(m.group(1))
+            if 2 <= len(name.split()) <= 6 and not _CEDENTE_BAD.search(name):
                 return name
 
-        patterns = [
-            r"Y\s+DE\s+OTRA\s+PARTE[:,\s]*D\.?\s*(?:ÑA|NA|N)?\.?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,60}?)\s*,\s*mayor\s+de\s+edad",
-            r"CEDENTE[:\s]*D\.?\s*(?:ÑA|NA|N)?\.?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,60}?)\s*,\s*mayor\s+de\s+edad",
-            r"D\.?\s*(?:ÑA|NA|N)?\.?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{6,60}?)\s*,\s*mayor\s+de\s+edad,\s*con\s+DNI",
-        ]
-
-        for p in patterns:
-            m = re.search(p, txt, re.IGNORECASE | re.DOTALL)
+        for p in _CEDENTE_NAME_PATTERNS:
+            m = p.search(txt)
             if m:
-                name = re.sub(r"\s+", " ", m.group(1)).strip()
-                if 2 <= len(name.split()) <= 6 and not bad_words.search(name):
+                name = _collapse_ws(m.group(1))
+                if 2 <= len(name.split()) <= 6 and not _CEDENTE_BAD.search(name):
                     return name
 
         return "NOT FOUND"
@@ -463,46 +679,21 @@ class ContratoParser(BaseDocumentParser):
         - keep/resolve the final letter properly
         - validate via checksum
         """
-        txt = getattr(self, "_cedente_txt", "") or self.text
-        txt = self._normalize(txt)
+        txt = self._cedente_txt or self.text
 
         # Helper: take a captured candidate and run it through the robust finder
         def _from_candidate(candidate: str) -> str:
             val = self._find_dni(candidate)
             return val if val != "NOT FOUND" else "NOT FOUND"
 
-        # ✅ 1) Direct pattern “De una parte ... con DNI XXXXX”
-        m = re.search(
-            r"De\s+una\s+parte.*?\bDNI\s*([0-9OIlL]{8}\s*[A-Z6IL1])",
-            txt,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if m:
-            val = _from_candidate(m.group(1))
-            if val != "NOT FOUND":
-                return val
-
-        # ✅ 2) “mayor de edad, con DNI …”
-        m = re.search(
-            r"mayor\s+de\s+edad,\s*con\s+DNI[:\s]*([0-9OIlL]{8}\s*[A-Z6IL1])",
-            txt,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if m:
-            val = _from_candidate(m.group(1))
-            if val != "NOT FOUND":
-                return val
-
-        # ✅ 3) Generic “DNI: …”
-        m = re.search(
-            r"\bDNI[:\s]*([0-9OIlL]{8}\s*[A-Z6IL1])\b",
-            txt,
-            re.IGNORECASE,
-        )
-        if m:
-            val = _from_candidate(m.group(1))
-            if val != "NOT FOUND":
-                return val
+        # ✅ 1-3) labelled patterns, all anchored on the word "DNI"
+        if self._has_anchor("DNI"):
+            for pattern in (_RE_CEDENTE_DNI_DIRECT, _RE_CEDENTE_DNI_MAYOR, _RE_CEDENTE_DNI_LABEL):
+                m = pattern.search(txt)
+                if m:
+                    val = _from_candidate(m.group(1))
+                    if val != "NOT FOUND":
+                        return val
 
         # ✅ 4) Fallback: scan the whole text (also catches IDESP…13103004L)
         val = self._find_dni(txt)
@@ -514,81 +705,69 @@ class ContratoParser(BaseDocumentParser):
         ✅ En tu contrato real está en:
         'con domicilio en ... , teléfono ...'
         """
-        t = getattr(self, "_cedente_txt", "") or (getattr(self, "_text_norm", "") or self.text)
+        t = self._cedente_txt or self._text_norm or self.text
 
-        m = re.search(
-            r"domicilio\s+en\s+(.{10,140}?)(?:,?\s*tel[eé]fono|\s+tel[eé]fono|\n)",
-            t,
-            re.IGNORECASE | re.DOTALL,
-        )
+        m = _RE_CEDENTE_ADDRESS.search(t)
         if m:
-            addr = re.sub(r"\s+", " ", m.group(1)).strip().rstrip(",;.")
+            addr = _collapse_ws(m.group(1)).rstrip(",;.")
             return addr if self._is_valid_text(addr, 8) else "NOT FOUND"
 
-        # fallback a location
-        loc = self._extract_location()
+        # fallback a location (ya calculada en parse())
+        loc = self._cached_location
+        if loc is None:
+            loc = self._extract_location()
         return loc if self._is_valid_text(loc, 8) else "NOT FOUND"
 
     def _extract_cedente_phone(self) -> str:
-        t = getattr(self, "_cedente_txt", "") or (getattr(self, "_text_norm", "") or self.text)
+        t = self._cedente_txt or self._text_norm or self.text
 
-        m = re.search(r"tel[eé]fono[^+\d]*([+\d][\d\s-]{8,})", t, re.IGNORECASE)
+        m = self._has_anchor("TEL") and _RE_PHONE_LABEL.search(t)
         if m:
-            phone = re.sub(r"[^\d+]", "", m.group(1))
-            if len(re.sub(r"\D", "", phone)) >= 9:
+            # the capture is only +, digits, whitespace and "-"
+            phone = "".join(m.group(1).split()).replace("-", "")
+            if len(phone) - phone.count("+") >= 9:
                 return phone
 
-        m = re.search(r"\b(\+34)?\s*(6\d{8}|7\d{8}|8\d{8}|9\d{8})\b", t)
+        m = _RE_PHONE.search(t)
         if m:
-            return re.sub(r"\s+", "", m.group(0)).replace(" ", "")
+            return "".join(m.group(0).split())
 
         return "NOT FOUND"
 
     def _extract_cedente_email(self) -> str:
-        t = getattr(self, "_cedente_txt", "") or (getattr(self, "_text_norm", "") or self.text)
-        m = re.search(r"[\w\.-]+@[\w\.-]+\.\w+", t)
+        if not self._has_anchor("@"):
+            return "NOT FOUND"
+        t = self._cedente_txt or self._text_norm or self.text
+        m = _RE_EMAIL.search(t)
         return m.group(0) if m else "NOT FOUND"
 
     def _extract_notifications(self) -> str:
-        t = getattr(self, "_cedente_txt", "") or (getattr(self, "_text_norm", "") or self.text)
-        m = re.search(r"[Nn]otificaciones[:\s]+(.+?)(?:\n|$)", t, re.IGNORECASE)
+        if not self._has_anchor("NOTIFICACIONES"):
+            return "NOT FOUND"
+        t = self._cedente_txt or self._text_norm or self.text
+        m = _RE_NOTIFICATIONS.search(t)
         if m:
-            val = re.sub(r"\s+", " ", m.group(1)).strip()
+            val = _collapse_ws(m.group(1))
             return val if self._is_valid_text(val, 8) else "NOT FOUND"
         return "NOT FOUND"
 
     def _check_cedente_signature(self) -> str:
-        t = getattr(self, "_text_norm", "") or self.text
-        signature_count = len(re.findall(r"Firma|Firmado|Fdo\.", t, re.IGNORECASE))
+        signature_count = self._signature_count()
         return f"{signature_count} signature(s) found" if signature_count > 0 else "NOT FOUND"
 
 
-    def _is_valid_spanish_dni(self, dni: str) -> bool:
-        dni = (dni or "").strip().upper().replace(" ", "")
-        if not re.match(r"^\d{8}[A-Z]$", dni):
-            return False
-        letters = "TRWAGMYFPDXBNJZSQVHLCKE"
-        num = int(dni[:8])
-        return dni[-1] == letters[num % 23]
-
     def _extract_sell_price(self) -> str:
         """
         Extrae precio de venta (€/kWh o €/IWh) del contrato.
         Busca patrones como "precio de venta", "€/kWh", "€/IWh", etc.
         """
-        t = getattr(self, "_text_norm", "") or self.text
+        if not (self._has_anchor("€") or self._has_anchor("EURO")):
+            return "NOT FOUND"
+        t = self._text_norm or self.text
 
         # Patrones comunes para precio de venta
-        patterns = [
-            r"contraprestación\s+en\s+especie\s+se\s+estima\s+en\s+un\s+valor\s+económico\s+equivalente\s+de\s+([\d\s,]+(?:\.\d+)?)\s*€",
-            r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
-            r"venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
-            r"([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
-            r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*euros?\s*por\s*[kI]Wh",
-        ]
-
-        for pattern in patterns:
-            m = re.search(pattern, t, re.IGNORECASE)
+        for anchor, pattern in _RE_SELL_PRICE:
+            m = self._has_anchor(anchor) and pattern.search(t)
             if m:
                 price = m.group(1).replace(",", ".").replace(" ", "")
                 try:
@@ -601,17 +780,10 @@ class ContratoParser(BaseDocumentParser):
 
     def _extract_start_date(self) -> str:
         """Extract start date from contrato"""
-        patterns = [
-            r"inici[oó]\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
-            r"[Ff]echa.*?inicio[:\s]+([\d/]+)",
-            r"desde\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
-            r"fecha\s+de\s+inicio[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-            r"vigencia\s+desde[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-            r"contrato\s+desde[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, self._text_norm, re.IGNORECASE)
+        if not (self._has_anchor("INICI") or self._has_anchor("DESDE")):
+            return "NOT FOUND"
+        for pattern in _RE_START_DATE:
+            match = pattern.search(self._text_norm)
             if match:
                 if len(match.groups()) == 3:
                     day, month, year = match.groups()
@@ -638,17 +810,10 @@ class ContratoParser(BaseDocumentParser):
 
     def _extract_finish_date(self) -> str:
         """Extract finish date from contrato"""
-        patterns = [
-            r"finaliz[oó].*?el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
-            r"[Ff]echa.*?fin[:\s]+([\d/]+)",
-            r"hasta\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
-            r"fecha\s+de\s+fin[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-            r"vigencia\s+hasta[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-            r"contrato\s+hasta[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, self._text_norm, re.IGNORECASE)
+        if not (self._has_anchor("FIN") or self._has_anchor("HASTA")):
+            return "NOT FOUND"
+        for pattern in _RE_FINISH_DATE:
+            match = pattern.search(self._text_norm)
             if match:
                 if len(match.groups()) == 3:
                     day, month, year = match.groups()
@@ -675,15 +840,8 @@ class ContratoParser(BaseDocumentParser):
 
     def _extract_lifespan(self) -> str:
         """Extract lifespan in years"""
-        patterns = [
-            r"duración.*?(\d+)\s*años?",
-            r"(\d+)\s*años?",
-            r"período.*?(\d+)\s*años?",
-            r"vigencia.*?(\d+)\s*años?",
-            r"10",  # common default
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self._text_norm, re.IGNORECASE)
+        for pattern in _RE_LIFESPAN:
+            match = pattern.search(self._text_norm)
             if match:
                 if len(match.groups()) > 0:
                     return f"{match.group(1)}"
@@ -2,83 +2,203 @@
 Parser for DECLARACION RESPONSABLE documents
 """
 
-from .base_parser import BaseDocumentParser
-from typing import Dict, Any
+from .base_parser import BaseDocumentParser, _collapse_ws, _is_valid_spanish_dni
+from typing import Dict, Any, Optional, Tuple
+import logging
 import re
 
 
+logger = logging.getLogger(__name__)
+
+_FLAGS = re.IGNORECASE | re.DOTALL
+
+# DNI
+_RE_DNI_OCR = re.compile(r"\b([0-9OIL]{8})\s*([A-Z6IL1])\b")
+
+# Homeowner name / DNI
+# Only ever run on the uppercased text (_upper_text), so no IGNORECASE:
+# case-sensitive classes skip the engine's per-char case folding.
+# NOMBRE + DNI on one line: (name, 8 "digits", control letter); shared by the
+# name and DNI extractors
+_RE_NAME_DNI_LINE = re.compile(r"\n([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{10,80})\s+([0-9OIL]{8})\s*([A-Z6IL1])\b")
+_RE_NAME_TITULAR = re.compile(
+    r"(?:TITULAR|SOLICITANTE|BENEFICIARIO)\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{10,80})"
+)
+_RE_NAME_DON = re.compile(r"\bD(?:ON|OÑA|\.)\s+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{10,80})\b")
+_RE_DNI_NIF_NIE = re.compile(r"NIF\s*/\s*NIE\s*[:\-]?\s*([0-9OIL]{8})\s*([A-Z6IL1])\b")
+
+# Address (tried in order)
+_RE_ADDRESS = tuple(
+    re.compile(p, _FLAGS)
+    for p in (
+        r"Domicilio\s+(.+?)(?=\n|,\s*\d{5}|CP|C\.P\.|Tel|Firma)",
+        r"Direcci[oó]n\s+(.+?)(?=\n|CP|C\.P\.|Tel|Firma)",
+        r"(?:Domicilio|Direcci[oó]n)\s*[:\-]?\s*\n\s*(.{10,220})",
+    )
+)
+_RE_DIGIT = re.compile(r"\d")
+_RE_ADDRESS_LOOSE = re.compile(r"([A-ZÁÉÍÓÚÑ]{2,}\s+\d{1,4}(?:[\w\s,.-]{0,40})\d{5})", re.IGNORECASE)
+
+# Catastral / act code / energy / surface
+_RE_CATASTRAL_A = re.compile(r"Referencia\s+catastral.*?([0-9A-Z]{10,25})", _FLAGS)
+_RE_CATASTRAL_STREET = re.compile(r"^(CL|C|CALLE|AV|AVENIDA|PL|PLAZA)")
+_RE_UPPER = re.compile(r"[A-Z]")
+_RE_CATASTRAL_B = re.compile(r"\b(\d{6,8}[A-Z]{1,3}\d{2,6}[A-Z]{1,4}\d{1,6}[A-Z]{1,4})\b")
+_RE_ACT_CODE = re.compile(r"(RES0*\d{2,3})", re.IGNORECASE)
+_RE_ACT_ZEROS = re.compile(r"RES0+(\d)")
+# (anchor, pattern), tried in order: a pattern can only match if its anchor
+# occurs in the uppercased text, so the scan is skipped when it doesn't
+_RE_ENERGY = tuple(
+    (anchor, re.compile(p, re.IGNORECASE))
+    for anchor, p in (
+        ("AHORRO", r"Ahorro.*?AE\s+([\d.]+)"),
+        ("AE", r"AE\s+([\d.]+)"),
+        ("AE", r"AE.*?([\d.]+)"),
+    )
+)
+_RE_SURFACE = tuple(
+    (anchor, re.compile(p, re.IGNORECASE))
+    for anchor, p in (
+        ("SUPERFICIE", r"superficie.*?(\d+(?:[.,]\d+)?)"),
+        ("=", r"s\s*=\s*(\d+(?:[.,]\d+)?)"),
+        ("ÁREA", r"área.*?(\d+(?:[.,]\d+)?)"),
+    )
+)
+_RE_ISOLATION = re.compile(r"(ROLLO|SOPLADO)", re.IGNORECASE)
+
+# _clean_address
+_RE_CLEAN_EJECUTO = re.compile(r"de la instalación en que se ejecut[oó]\s*", re.IGNORECASE)
+_RE_CLEAN_INSTALACION = re.compile(r"de la instalaci[oó]n.*?(?=[A-ZÁÉÍÓÚÑ0-9])", re.IGNORECASE)
+_RE_INSTALACI = re.compile(r"instalaci", re.IGNORECASE)
+_RE_STREET_START = re.compile(r"[A-ZÁÉÍÓÚÑ][A-ZÁÉÍÓÚÑ\s\.\-]{2,}\d")
+_RE_UPTO_INSTALACION = re.compile(r"(?i)^.*?instalaci[óo]n\s*[:\-]?\s*")
+_RE_LEADING_JUNK = re.compile(r'^[!"\s]*')
+_RE_LEADING_PHRASE = re.compile(r"^(?:en que se|en la que se|en que|para la instalaci[oó]n)\s*", re.IGNORECASE)
+_RE_VOWEL = re.compile(r"[AEIOUÁÉÍÓÚ]", re.IGNORECASE)
+_RE_LEADING_TOKEN = re.compile(r"^([A-ZÁÉÍÓÚÑ]{3,})(?:\s+|$)")
+_RE_TEMPLATE_PREFIX = re.compile(
+    r"^(?:domicilio|direcci[oó]n|direccion|postal|c[oó]digo\s*postal|postal de la instalaci[oó]n.*?|de la instalaci[oó]n.*?)(?:\s+en\s+que\s+se\s+ejecut[oó].*?)?\s*[:\-]?\s*",
+    re.IGNORECASE,
+)
+_RE_STREET_TYPE = re.compile(r"\b(?:PZ|PZA|PLAZA|CALLE|C\.?|AV(?:D?A)?|AVENIDA|PL|Pº|PSO|PASEO|RUA|R\.)\b", re.IGNORECASE)
+_RE_NOT_ADDRESS = re.compile(r"Tel[eé]fono|Correo electr[oó]nico|Firma|Firmado", re.IGNORECASE)
+
+# Address candidates that are just a label / bare street-type token
+_ADDRESS_GARBAGE_LOW = frozenset({"teléfono", "telefono", "tel", "telf", "tfno", "firma", "firmado"})
+_ADDRESS_GARBAGE_UP = frozenset({"C", "CL", "CALLE", "AV", "AVD", "S/N"})
+
+
+def _is_garbage_address(val: str) -> bool:
+    v = (val or "").strip()
+    if not v:
+        return True
+    return v.lower() in _ADDRESS_GARBAGE_LOW or v.upper() in _ADDRESS_GARBAGE_UP
+
+
+_CONTEXT_TYPES = ("CONTRATO", "FACTURA", "CEE", "CEE_FINAL")
+
+
+def _homeowner_key(name, dni) -> Optional[Tuple[str, str]]:
+    """(NAME, DNI) normalized for comparison, or None if either is missing."""
+    if name and dni:
+        return (name.strip().upper(), dni.strip().upper())
+    return None
+
+
+def _fallback_context(context, field, prefer_types=_CONTEXT_TYPES, want=None):
+    """
+    First usable `field` value among the already-parsed documents in `context`.
+
+    With `want` (a _homeowner_key), only documents for the same homeowner count.
+    """
+    if not context or not isinstance(context, dict):
+        return None
+    for doc_type in prefer_types:
+        docs = context.get(doc_type)
+        if not docs:
+            continue
+        if isinstance(docs, dict):
+            docs = [docs]
+        for doc in docs:
+            if want:
+                n2 = doc.get("homeowner_name") or doc.get("client_name")
+                d2 = doc.get("homeowner_dni") or doc.get("dni_number")
+                if _homeowner_key(n2, d2) != want:
+                    continue
+            val = doc.get(field)
+            if val and val != "NOT FOUND":
+                return val
+    return None
+
+
 class DeclaracionParser(BaseDocumentParser):
     """Parser for Declaración Responsable"""
 
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._text_upper: Optional[str] = None
+        # raw extractor results (before context fallback), reused by the address fallback
+        self._cached_name: Optional[str] = None
+        self._cached_dni: Optional[str] = None
+        # (uppercased text, _RE_NAME_DNI_LINE match) for that text
+        self._name_dni_line: Optional[Tuple[str, Optional[re.Match]]] = None
+
     def parse(self) -> Dict[str, Any]:
         self.extract_text()
+        # name, DNI and signature extractors all scan the uppercased text
+        self._text_upper = (self.text or "").upper()
+        self._cached_name = None
+        self._cached_dni = None
 
-        # Fallback helpers
-        def fallback_context(field, prefer_types=None, match_name=None, match_dni=None):
-            context = getattr(self, 'context_data', None)
-            if not context or not isinstance(context, dict):
-                return None
-            prefer_types = prefer_types or ["CONTRATO", "FACTURA", "CEE", "CEE_FINAL"]
-            for doc_type in prefer_types:
-                docs = context.get(doc_type)
-                if not docs:
-                    continue
-                if isinstance(docs, dict):
-                    docs = [docs]
-                for doc in docs:
-                    # Si se pide coincidencia de nombre/dni, filtra
-                    if match_name and match_dni:
-                        n2 = doc.get("homeowner_name") or doc.get("client_name")
-                        d2 = doc.get("homeowner_dni") or doc.get("dni_number")
-                        if not (n2 and d2 and n2.strip().upper() == match_name.strip().upper() and d2.strip().upper() == match_dni.strip().upper()):
-                            continue
-                    val = doc.get(field)
-                    if val and val != "NOT FOUND":
-                        return val
-            return None
+        context = getattr(self, 'context_data', None)
 
         # 1. Nombre
         name = self._extract_homeowner_name()
+        self._cached_name = name
         if not name or name == "NOT FOUND":
-            name_ctx = fallback_context("homeowner_name")
+            name_ctx = _fallback_context(context, "homeowner_name")
             if name_ctx:
                 name = name_ctx
 
         # 2. DNI
         dni = self._extract_homeowner_dni()
+        self._cached_dni = dni
         if not dni or dni == "NOT FOUND":
-            dni_ctx = fallback_context("homeowner_dni")
+            dni_ctx = _fallback_context(context, "homeowner_dni")
             if dni_ctx:
                 dni = dni_ctx
 
+        # nombre/DNI normalizados una vez para los fallbacks que exigen coincidencia
+        want = _homeowner_key(name, dni)
+
         # 3. Dirección (ya tiene fallback propio)
         address = self._extract_homeowner_address()
 
         # 4. Referencia catastral
         catastral = self._extract_catastral_ref()
         if not catastral or catastral == "NOT FOUND":
-            catastral_ctx = fallback_context("catastral_ref", match_name=name, match_dni=dni)
+            catastral_ctx = _fallback_context(context, "catastral_ref", want=want)
             if catastral_ctx:
                 catastral = catastral_ctx
 
         # 5. Código de actuación
         act_code = self._extract_act_code()
         if not act_code or act_code == "NOT FOUND":
-            act_code_ctx = fallback_context("act_code", match_name=name, match_dni=dni)
+            act_code_ctx = _fallback_context(context, "act_code", want=want)
             if act_code_ctx:
                 act_code = act_code_ctx
 
         # 6. Ahorro energético
         energy_savings = self._extract_energy_savings()
         if not energy_savings or energy_savings == "NOT FOUND":
-            energy_ctx = fallback_context("energy_savings", match_name=name, match_dni=dni)
+            energy_ctx = _fallback_context(context, "energy_savings", want=want)
             if energy_ctx:
                 energy_savings = energy_ctx
 
         # 7. Superficie
         surface = self._extract_surface()
         if not surface or surface == "NOT FOUND":
-            surface_ctx = fallback_context("surface", match_name=name, match_dni=dni)
+            surface_ctx = _fallback_context(context, "surface", want=want)
             if surface_ctx:
                 surface = surface_ctx
 
@@ -105,13 +225,20 @@ class DeclaracionParser(BaseDocumentParser):
     # DNI helpers (OCR tolerant)
     # ------------------------
 
-    def _is_valid_spanish_dni(self, dni: str) -> bool:
-        dni = (dni or "").strip().upper().replace(" ", "")
-        if not re.match(r"^\d{8}[A-Z]$", dni):
-            return False
-        letters = "TRWAGMYFPDXBNJZSQVHLCKE"
-        num = int(dni[:8])
-        return dni[-1] == letters[num % 23]
+    def _upper_text(self) -> str:
+        """self.text uppercased, computed once per parse()."""
+        up = self._text_upper
+        if up is None:
+            up = self._text_upper = (self.text or "").upper()
+        return up
+
+    def _search_name_dni_line(self) -> Optional[re.Match]:
+        """_RE_NAME_DNI_LINE on the uppercased text, searched once per text."""
+        up = self._upper_text()
+        cached = self._name_dni_line
+        if cached is None or cached[0] is not up:
+            cached = self._name_dni_line = (up, _RE_NAME_DNI_LINE.search(up))
+        return cached[1]
 
     def _normalize_dni_parts(self, raw_num: str, raw_last: str) -> str:
         """
@@ -138,33 +265,30 @@ class DeclaracionParser(BaseDocumentParser):
 
         for L in last_candidates:
             cand = f"{num}{L}"
-            if self._is_valid_spanish_dni(cand):
+            if _is_valid_spanish_dni(cand):
                 return cand
 
         return ""
 
-    def _find_any_valid_dni(self, t: str) -> str:
+    def _find_any_valid_dni(self, t: str, up: Optional[str] = None) -> str:
         """
         Fallback global: busca cualquier DNI válido en todo el texto.
         Soporta OCR en dígitos (O/I/L) y letra final (6->G).
+        `up` es t.upper() si ya está calculado.
         """
         if not t:
             return "NOT FOUND"
 
-        txt = (t or "").upper()
+        txt = up if up is not None else t.upper()
 
         # buscamos 8 "dígitos" tolerantes + 1 letra tolerante
-        for m in re.finditer(r"\b([0-9OIL]{8})\s*([A-Z6IL1])\b", txt):
+        # (un DNI limpio \b\d{8}[A-Z]\b también encaja aquí en la misma posición
+        # y se valida igual, así que no hace falta una segunda pasada "limpia")
+        for m in _RE_DNI_OCR.finditer(txt):
             dni = self._normalize_dni_parts(m.group(1), m.group(2))
             if dni:
                 return dni
 
-        # fallback clásico por si el OCR vino limpio
-        for m in re.finditer(r"\b(\d{8})([A-Z])\b", txt):
-            cand = f"{m.group(1)}{m.group(2)}"
-            if self._is_valid_spanish_dni(cand):
-                return cand
-
         return "NOT FOUND"
 
     # ------------------------
@@ -172,38 +296,26 @@ class DeclaracionParser(BaseDocumentParser):
     # ------------------------
 
     def _extract_homeowner_name(self) -> str:
-        t = self.text or ""
+        up = self._upper_text()
 
         # 1) Línea NOMBRE + DNI (prioridad) (mayúsculas típicas OCR)
-        m = re.search(
-            r"\n([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{10,80})\s+([0-9OIL]{8}\s*[A-Z6IL1])\b",
-            t.upper(),
-            re.IGNORECASE
-        )
+        m = self._search_name_dni_line()
         if m:
-            name = re.sub(r"\s+", " ", m.group(1)).strip()
+            name = _collapse_ws(m.group(1))
             if 2 <= len(name.split()) <= 8 and "PROPIETARIO INICIAL DEL AHORRO" not in name.upper() and "BONO SOCIAL" not in name.upper() and "PERCEPTORES" not in name.upper():
                 return name
 
         # 2) Titular / Solicitante / Beneficiario
-        m = re.search(
-            r"(?:TITULAR|SOLICITANTE|BENEFICIARIO)\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{10,80})",
-            t.upper(),
-            re.IGNORECASE,
-        )
+        m = ("TITULAR" in up or "SOLICITANTE" in up or "BENEFICIARIO" in up) and _RE_NAME_TITULAR.search(up)
         if m:
-            name = re.sub(r"\s+", " ", m.group(1)).strip()
+            name = _collapse_ws(m.group(1))
             if 2 <= len(name.split()) <= 8 and "PROPIETARIO INICIAL DEL AHORRO" not in name.upper() and "BONO SOCIAL" not in name.upper() and "PERCEPTORES" not in name.upper():
                 return name
 
         # 3) Don/Doña/D.
-        m = re.search(
-            r"\bD(?:ON|OÑA|\.)\s+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{10,80})\b",
-            t.upper(),
-            re.IGNORECASE,
-        )
+        m = _RE_NAME_DON.search(up)
         if m:
-            name = re.sub(r"\s+", " ", m.group(1)).strip()
+            name = _collapse_ws(m.group(1))
             if 2 <= len(name.split()) <= 10 and "PROPIETARIO INICIAL DEL AHORRO" not in name.upper() and "BONO SOCIAL" not in name.upper() and "PERCEPTORES" not in name.upper():
                 return name
 
@@ -211,88 +323,75 @@ class DeclaracionParser(BaseDocumentParser):
 
     def _extract_homeowner_dni(self) -> str:
         t = self.text or ""
-        up = t.upper()
+        up = self._upper_text()
 
         # 1) DNI en línea NOMBRE + DNI
-        m = re.search(
-            r"\n([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]{10,80})\s+([0-9OIL]{8})\s*([A-Z6IL1])\b",
-            up,
-            re.IGNORECASE
-        )
+        m = self._search_name_dni_line()
         if m:
             dni = self._normalize_dni_parts(m.group(2), m.group(3))
             if dni:
                 return dni
 
         # 2) Cerca de "NIF/NIE"
-        m = re.search(
-            r"NIF\s*/\s*NIE\s*[:\-]?\s*([0-9OIL]{8})\s*([A-Z6IL1])\b",
-            up,
-            re.IGNORECASE,
-        )
+        m = "NIF" in up and _RE_DNI_NIF_NIE.search(up)
         if m:
             dni = self._normalize_dni_parts(m.group(1), m.group(2))
             if dni:
                 return dni
 
         # 3) Fallback global (lo más útil en OCR raro)
-        return self._find_any_valid_dni(t)
+        return self._find_any_valid_dni(t, up)
 
     def _extract_homeowner_address(self) -> str:
         t = self.text or ""
-        debug_label = "[DECLARACION] Dirección extraída:"
-        def is_garbage(val: str) -> bool:
-            v = (val or "").strip()
-            if not v:
-                return True
-            v_low = v.lower()
-            if v_low in {"teléfono", "telefono", "tel", "telf", "tfno", "firma", "firmado"}:
-                return True
-            if v.strip().upper() in {"C", "CL", "CALLE", "AV", "AVD", "S/N"}:
-                return True
-            return False
+        debug_label = "[DECLARACION] Dirección extraída: (%s) %r"
 
         # 1) Patrones clásicos
-        patterns = [
-            r"Domicilio\s+(.+?)(?=\n|,\s*\d{5}|CP|C\.P\.|Tel|Firma)",
-            r"Direcci[oó]n\s+(.+?)(?=\n|CP|C\.P\.|Tel|Firma)",
-            r"(?:Domicilio|Direcci[oó]n)\s*[:\-]?\s*\n\s*(.{10,220})",
-        ]
-        for pattern in patterns:
-            m = re.search(pattern, t, re.IGNORECASE | re.DOTALL)
+        for pattern in _RE_ADDRESS:
+            m = pattern.search(t)
             if m:
-                val = re.sub(r"\s+", " ", m.group(1)).strip().rstrip(",;.")
+                val = _collapse_ws(m.group(1)).rstrip(",;.")
                 val = self._clean_address(val)
-                if not is_garbage(val) and val != "NOT FOUND":
-                    print(f"{debug_label} (patrón clásico) '{val}'")
+                if not _is_garbage_address(val) and val != "NOT FOUND":
+                    logger.debug(debug_label, "patrón clásico", val)
                     return val
                 # Si el valor es 'NOT FOUND', ignora y sigue buscando
 
         # 2) Fallback: busca la primera línea larga con número (como en contrato)
-        lines = [ln.strip() for ln in t.splitlines() if len(ln.strip()) > 10]
-        candidates = [ln for ln in lines if re.search(r"\d", ln) and not is_garbage(ln)]
-        if candidates:
-            # Prefiere la más larga con número
-            best = max(candidates, key=len)
+        # Prefiere la más larga con número (la primera si empatan). Sólo se
+        # busca el dígito en líneas más largas que la mejor hasta ahora; una
+        # línea de >10 caracteres nunca es una de las etiquetas "basura".
+        best = ""
+        for ln in t.splitlines():
+            ln = ln.strip()
+            if len(ln) > len(best) and len(ln) > 10 and _RE_DIGIT.search(ln):
+                best = ln
+        if best:
             best = self._clean_address(best)
-            if not is_garbage(best):
-                print(f"{debug_label} (línea larga con número) '{best}'")
+            if not _is_garbage_address(best):
+                logger.debug(debug_label, "línea larga con número", best)
                 return best
 
         # 3) Fallback: busca cualquier cosa que parezca dirección
-        m = re.search(r"([A-ZÁÉÍÓÚÑ]{2,}\s+\d{1,4}(?:[\w\s,.-]{0,40})\d{5})", t, re.IGNORECASE)
+        m = _RE_ADDRESS_LOOSE.search(t)
         if m:
             val = self._clean_address(m.group(1))
-            if not is_garbage(val):
-                print(f"{debug_label} (regex dirección) '{val}'")
+            if not _is_garbage_address(val):
+                logger.debug(debug_label, "regex dirección", val)
                 return val
 
         # 4) Fallback: buscar dirección en otros documentos si hay acceso a todos los datos
         # Busca en self.context_data si está disponible (debe ser dict con otros docs)
-        name = self._extract_homeowner_name()
-        dni = self._extract_homeowner_dni()
         context = getattr(self, 'context_data', None)
         if context and isinstance(context, dict):
+            # nombre/DNI ya extraídos en parse()
+            name = self._cached_name
+            if name is None:
+                name = self._extract_homeowner_name()
+            dni = self._cached_dni
+            if dni is None:
+                dni = self._extract_homeowner_dni()
+            want = _homeowner_key(name, dni)
             # Busca en CONTRATO primero, aunque no coincida nombre/dni
             contrato = context.get("CONTRATO")
             if contrato:
@@ -300,8 +399,8 @@ class DeclaracionParser(BaseDocumentParser):
                     contrato = [contrato]
                 for doc in contrato:
                     addr = doc.get("homeowner_address")
-                    if addr and not is_garbage(addr) and addr != "NOT FOUND":
-                        print(f"{debug_label} (copiado de CONTRATO) '{addr}'")
+                    if addr and not _is_garbage_address(addr) and addr != "NOT FOUND":
+                        logger.debug(debug_label, "copiado de CONTRATO", addr)
                         return addr
             # Si no hay en CONTRATO, busca en FACTURA, CEE, CEE_FINAL con coincidencia de nombre/dni
             for doc_type in ["FACTURA", "CEE", "CEE_FINAL"]:
@@ -313,35 +412,28 @@ class DeclaracionParser(BaseDocumentParser):
                 for doc in docs:
                     n2 = doc.get("homeowner_name") or doc.get("client_name")
                     d2 = doc.get("homeowner_dni") or doc.get("dni_number")
-                    if n2 and d2 and n2.strip().upper() == name.strip().upper() and d2.strip().upper() == dni.strip().upper():
+                    if want and _homeowner_key(n2, d2) == want:
                         for addr_field in ["homeowner_address", "address", "location"]:
                             addr = doc.get(addr_field)
-                            if addr and not is_garbage(addr) and addr != "NOT FOUND":
-                                print(f"{debug_label} (copiado de {doc_type} campo {addr_field}) '{addr}'")
+                            if addr and not _is_garbage_address(addr) and addr != "NOT FOUND":
+                                logger.debug(debug_label, f"copiado de {doc_type} campo {addr_field}", addr)
                                 return addr
 
-        print(f"{debug_label} (NO ENCONTRADA) 'NOT FOUND'")
+        logger.debug(debug_label, "NO ENCONTRADA", "NOT FOUND")
         return "NOT FOUND"
 
     def _extract_catastral_ref(self) -> str:
         t = self.text or ""
 
-        m = re.search(
-            r"Referencia\s+catastral.*?([0-9A-Z]{10,25})",
-            t,
-            re.IGNORECASE | re.DOTALL,
-        )
+        m = "REFERENCIA" in self._upper_text() and _RE_CATASTRAL_A.search(t)
         if m:
-            ref = re.sub(r"\s+", "", m.group(1)).strip().upper()
-            if re.match(r"^(CL|C|CALLE|AV|AVENIDA|PL|PLAZA)", ref):
+            ref = "".join(m.group(1).split()).upper()
+            if _RE_CATASTRAL_STREET.match(ref):
                 return "NOT FOUND"
-            if re.search(r"[A-Z]", ref) and re.search(r"\d", ref) and 10 <= len(ref) <= 25:
+            if _RE_UPPER.search(ref) and _RE_DIGIT.search(ref) and 10 <= len(ref) <= 25:
                 return ref
 
-        m = re.search(
-            r"\b(\d{6,8}[A-Z]{1,3}\d{2,6}[A-Z]{1,4}\d{1,6}[A-Z]{1,4})\b",
-            t,
-        )
+        m = _RE_CATASTRAL_B.search(t)
         if m:
             return m.group(1).upper()
 
@@ -349,84 +441,81 @@ class DeclaracionParser(BaseDocumentParser):
 
     def _extract_act_code(self) -> str:
         t = self.text or ""
-        m = re.search(r"(RES0*\d{2,3})", t, re.IGNORECASE)
+        if "RES" not in self._upper_text():
+            return "NOT FOUND"
+        m = _RE_ACT_CODE.search(t)
         if m:
             code = m.group(1).upper()
-            code = re.sub(r"RES0+(\d)", r"RES0\1", code)
+            code = _RE_ACT_ZEROS.sub(r"RES0\1", code)
             return code
         return "NOT FOUND"
 
     def _extract_energy_savings(self) -> str:
-        patterns = [
-            r"Ahorro.*?AE\s+([\d.]+)",
-            r"AE\s+([\d.]+)",
-            r"AE.*?([\d.]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
+        up = self._upper_text()
+        for anchor, pattern in _RE_ENERGY:
+            if anchor not in up:
+                continue
+            match = pattern.search(self.text)
             if match:
                 return f"{match.group(1)}"
         return "NOT FOUND"
 
     def _extract_surface(self) -> str:
-        patterns = [
-            r"superficie.*?(\d+(?:[.,]\d+)?)",
-            r"s\s*=\s*(\d+(?:[.,]\d+)?)",
-            r"área.*?(\d+(?:[.,]\d+)?)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
+        up = self._upper_text()
+        for anchor, pattern in _RE_SURFACE:
+            if anchor not in up:
+                continue
+            match = pattern.search(self.text)
             if match:
                 return match.group(1).replace(",", ".")
         return "NOT FOUND"
 
     def _extract_isolation_type(self) -> str:
-        patterns = [
-            r"(ROLLO|SOPLADO)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
+        up = self._upper_text()
+        if "ROLLO" not in up and "SOPLADO" not in up:
+            return "NOT FOUND"
+        match = _RE_ISOLATION.search(self.text)
+        if match:
+            return match.group(1).upper()
         return "NOT FOUND"
 
     def _check_signature(self) -> str:
-        t = self.text or ""
-        return "Present" if re.search(r"Firma|Firmado|Fdo\.", t, re.IGNORECASE) else "NOT FOUND"
+        # "Firmado" starts with "Firma": two substring tests cover all three labels
+        up = self._upper_text()
+        return "Present" if "FIRMA" in up or "FDO." in up else "NOT FOUND"
 
     def _clean_address(self, addr: str) -> str:
         if not addr:
             return addr
 
-        a = re.sub(r"\s+", " ", addr).strip()
+        a = _collapse_ws(addr)
 
         # Quita prefijos específicos de basura OCR/plantilla (más robusto)
         # Borra la forma exacta que ya manejábamos
-        a = re.sub(r"de la instalación en que se ejecut[oó]\s*", "", a, flags=re.IGNORECASE)
+        a = _RE_CLEAN_EJECUTO.sub("", a)
         # Si el texto contiene una referencia a "instalación" corrupta, intenta
         # eliminar la parte de plantilla hasta la primera porción que parezca
         # realmente una dirección (mayúscula + texto + número)
-        a = re.sub(r"de la instalaci[oó]n.*?(?=[A-ZÁÉÍÓÚÑ0-9])", "", a, flags=re.IGNORECASE)
-        if re.search(r"instalaci", a, re.IGNORECASE):
-            m = re.search(r"[A-ZÁÉÍÓÚÑ][A-ZÁÉÍÓÚÑ\s\.\-]{2,}\d", a)
+        a = _RE_CLEAN_INSTALACION.sub("", a)
+        if _RE_INSTALACI.search(a):
+            m = _RE_STREET_START.search(a)
             if m:
                 a = a[m.start():]
             else:
-                a = re.sub(r"(?i)^.*?instalaci[óo]n\s*[:\-]?\s*", "", a)
+                a = _RE_UPTO_INSTALACION.sub("", a)
 
-        a = re.sub(r'^[!"\s]*', '', a)  # Quita caracteres de inicio residuales
+        a = _RE_LEADING_JUNK.sub('', a)  # Quita caracteres de inicio residuales
 
         # Quita frases iniciales tipo "en que se" o similares que sobreviven
-        a = re.sub(r'^(?:en que se|en la que se|en que|para la instalaci[oó]n)\s*', '', a, flags=re.IGNORECASE)
+        a = _RE_LEADING_PHRASE.sub('', a)
 
         # Elimina tokens iniciales claramente corruptos: palabras MAYÚSCULAS
         # muy consonánticas (sin suficientes vocales) que preceden a la dirección
         def _has_enough_vowels(tok: str) -> bool:
-            return len(re.findall(r'[AEIOUÁÉÍÓÚ]', tok, re.IGNORECASE)) >= 2
+            return len(_RE_VOWEL.findall(tok)) >= 2
 
         while True:
-            m = re.match(r'^([A-ZÁÉÍÓÚÑ]{3,})(?:\s+|$)', a)
+            m = _RE_LEADING_TOKEN.match(a)
             if not m:
                 break
             tok = m.group(1)
@@ -436,35 +525,34 @@ class DeclaracionParser(BaseDocumentParser):
             a = a[len(tok):].lstrip()
 
         # Quita prefijos típicos de plantilla/OCR
-        a = re.sub(
-            r"^(?:domicilio|direcci[oó]n|direccion|postal|c[oó]digo\s*postal|postal de la instalaci[oó]n.*?|de la instalaci[oó]n.*?)(?:\s+en\s+que\s+se\s+ejecut[oó].*?)?\s*[:\-]?\s*",
-            "",
-            a,
-            flags=re.IGNORECASE,
-        )
+        a = _RE_TEMPLATE_PREFIX.sub("", a)
 
         # Si metió separadores tipo "|" o "—", quédate con el lado más “dirección”
         if "|" in a:
-            parts = [p.strip() for p in a.split("|") if p.strip()]
-            # normalmente la dirección es la parte más corta y con números
-            parts = sorted(parts, key=len)
-            for p in parts:
-                if re.search(r"\d", p):
-                    a = p
-                    break
-            else:
-                a = parts[-1]
+            # normalmente la dirección es la parte más corta y con números;
+            # si ninguna tiene números, la más larga (la última si empatan)
+            shortest_num = None
+            longest = ""
+            for p in a.split("|"):
+                p = p.strip()
+                if not p:
+                    continue
+                if (shortest_num is None or len(p) < len(shortest_num)) and _RE_DIGIT.search(p):
+                    shortest_num = p
+                if len(p) >= len(longest):
+                    longest = p
+            a = shortest_num if shortest_num is not None else longest
 
         # Limpieza final
         a = a.strip(" ,;.-")
 
         # Si queda basura inicial, busca el primer indicio claro de calle/plaza
-        m = re.search(r"\b(?:PZ|PZA|PLAZA|CALLE|C\.?|AV(?:D?A)?|AVENIDA|PL|Pº|PSO|PASEO|RUA|R\.)\b", a, re.IGNORECASE)
+        m = _RE_STREET_TYPE.search(a)
         if m and m.start() > 0:
             a = a[m.start():].strip()
 
         # Si contiene teléfono o firma, no es dirección
-        if re.search(r"Tel[eé]fono|Correo electr[oó]nico|Firma|Firmado", a, re.IGNORECASE):
+        if _RE_NOT_ADDRESS.search(a):
             return "NOT FOUND"
 
         return a
@@ -8,16 +8,45 @@ Parser for DNI documents
 - MRZ / IDESP fallback (embedded DNI like IDESP...13103004L)
 """
 
-from .base_parser import BaseDocumentParser
-from typing import Dict, Any
+from .base_parser import BaseDocumentParser, _collapse_ws, _is_valid_spanish_dni
+from typing import Dict, Any, Optional
 import re
 
 
+# DNI number
+_RE_DNI_CLEAN = re.compile(r"(\d{8}[A-Z])")
+_RE_DNI_OCR = re.compile(r"([0-9OIL]{8})([A-Z6IL1])")
+
+# MRZ (runs on the uppercased text)
+_RE_MRZ_LINE = re.compile(r"[A-Z0-9<]{20,}")
+_RE_MRZ_DNI_PREFIX = re.compile(r"\d{8}[A-Z]")
+_RE_MRZ_LONG_DIGITS = re.compile(r"\d{8,}")
+
+# Name (tried in order; the NOMBRE-first layout has the groups swapped)
+_RE_NAME_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"APELLIDOS\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{4,})\s+NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})",
+        r"NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})\s+APELLIDOS\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{4,})",
+        r"APELLIDOS\s+Y\s+NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{8,})",
+        r"1\s*APELLIDO\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})\s+2\s*APELLIDO\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})\s+NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})",
+    )
+)
+_RE_CAPS_LINE = re.compile(r"[A-ZÑÁÉÍÓÚ\s]{10,}")
+_RE_NAME_LABELS = re.compile(r"\b(APELLIDOS|NOMBRE|DOCUMENTO|NIF|DNI|SEXO|NACIONALIDAD|FECHA|CADUCIDAD)\b")
+
+
 class DniParser(BaseDocumentParser):
     """Parser for DNI"""
 
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._text_upper: Optional[str] = None
+
     def parse(self) -> Dict[str, Any]:
         self.extract_text()
+        # the DNI scan and the MRZ name both work on the uppercased text
+        self._text_upper = (self.text or "").upper()
         return {
             "document_type": "DNI",
             "dni_number": self._extract_dni_number(),
@@ -28,6 +57,13 @@ class DniParser(BaseDocumentParser):
     # Helpers
     # ------------------------
 
+    def _upper_text(self) -> str:
+        """self.text uppercased, computed once per parse()."""
+        up = self._text_upper
+        if up is None:
+            up = self._text_upper = (self.text or "").upper()
+        return up
+
     def _normalize_common(self, t: str) -> str:
         """Upper + remove separators. IMPORTANT: do NOT replace L->1 here."""
         t = (t or "").upper()
@@ -40,14 +76,6 @@ class DniParser(BaseDocumentParser):
         eight = eight.replace("O", "0").replace("I", "1").replace("L", "1")
         return eight
 
-    def _is_valid_spanish_dni(self, dni: str) -> bool:
-        dni = (dni or "").strip().upper().replace(" ", "")
-        if not re.match(r"^\d{8}[A-Z]$", dni):
-            return False
-        letters = "TRWAGMYFPDXBNJZSQVHLCKE"
-        num = int(dni[:8])
-        return dni[-1] == letters[num % 23]
-
     # ------------------------
     # DNI extractor
     # ------------------------
@@ -64,26 +92,26 @@ class DniParser(BaseDocumentParser):
         if not self.text:
             return "NOT FOUND"
 
-        raw = (self.text or "").upper()
+        raw = self._upper_text()
 
         # 1) Fast path: find any clean DNI (works for embedded IDESP...13103004L)
-        m = re.search(r"(\d{8}[A-Z])", raw)
-        if m and self._is_valid_spanish_dni(m.group(1)):
+        m = _RE_DNI_CLEAN.search(raw)
+        if m and _is_valid_spanish_dni(m.group(1)):
             return m.group(1)
 
         # 2) Check MRZ lines for document number
-        mrz_lines = re.findall(r"[A-Z0-9<]{20,}", raw)
+        mrz_lines = _RE_MRZ_LINE.findall(raw)
         for line in mrz_lines:
             # Spanish MRZ second line starts with document number
-            if re.match(r"^\d{8}[A-Z]", line):
+            if _RE_MRZ_DNI_PREFIX.match(line):
                 cand = line[:9]
-                if self._is_valid_spanish_dni(cand):
+                if _is_valid_spanish_dni(cand):
                     return cand
 
         # 3) OCR-tolerant scan
         t = self._normalize_common(raw)
 
-        for m in re.finditer(r"([0-9OIL]{8})([A-Z6IL1])", t):
+        for m in _RE_DNI_OCR.finditer(t):
             raw_num, raw_last = m.groups()
             num = self._normalize_numeric_part(raw_num)
 
@@ -97,7 +125,7 @@ class DniParser(BaseDocumentParser):
 
             for last in last_candidates:
                 cand = f"{num}{last}"
-                if self._is_valid_spanish_dni(cand):
+                if _is_valid_spanish_dni(cand):
                     return cand
 
         return "NOT FOUND"
@@ -114,12 +142,12 @@ class DniParser(BaseDocumentParser):
         if not self.text:
             return "NOT FOUND"
 
-        t = (self.text or "").upper()
-        mrz_lines = re.findall(r"[A-Z0-9<]{20,}", t)
+        t = self._upper_text()
+        mrz_lines = _RE_MRZ_LINE.findall(t)
         if not mrz_lines:
             return "NOT FOUND"
 
-        candidates = [ln for ln in mrz_lines if "<<" in ln and re.match(r"^[A-Z]", ln)]
+        candidates = [ln for ln in mrz_lines if "<<" in ln and "A" <= ln[0] <= "Z"]
         if not candidates:
             candidates = [ln for ln in mrz_lines if "<<" in ln]
 
@@ -129,13 +157,13 @@ class DniParser(BaseDocumentParser):
         line = max(candidates, key=len)
         
         # ✅ Rechazar líneas que parecen ID/IDESP/CET basura
-        if "IDESP" in line or "IDES" in line or re.search(r"\d{8,}", line):
+        if "IDESP" in line or "IDES" in line or _RE_MRZ_LONG_DIGITS.search(line):
             return "NOT FOUND"
 
         parts = line.split("<<", 1)
         surname = parts[0].replace("<", " ").strip()
         given = parts[1].replace("<", " ").strip() if len(parts) > 1 else ""
-        full = re.sub(r"\s+", " ", f"{surname} {given}").strip()
+        full = _collapse_ws(f"{surname} {given}")
 
         # ✅ Validar antes de devolver
         if len(full) < 6 or self._is_garbage_name(full):
@@ -158,16 +186,9 @@ class DniParser(BaseDocumentParser):
 
         t = self.text.strip()
 
-        # 2) Patrones estructurados
-        patterns = [
-            r"APELLIDOS\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{4,})\s+NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})",
-            r"NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})\s+APELLIDOS\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{4,})",
-            r"APELLIDOS\s+Y\s+NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{8,})",
-            r"1\s*APELLIDO\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})\s+2\s*APELLIDO\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})\s+NOMBRE\s*[:\-]?\s*([A-ZÑÁÉÍÓÚ\s]{2,})",
-        ]
-
-        for i, p in enumerate(patterns):
-            m = re.search(p, t, re.IGNORECASE)
+        # 2) Patrones estructurados (todos llevan la etiqueta NOMBRE)
+        for i, p in enumerate(_RE_NAME_PATTERNS if "NOMBRE" in self._upper_text() else ()):
+            m = p.search(t)
             if m:
                 print(f"🐛 Pattern {i} matched: {m.groups()}")
                 if len(m.groups()) == 1:
@@ -175,7 +196,7 @@ class DniParser(BaseDocumentParser):
                 elif len(m.groups()) == 2:
                     a = self._clean_name(m.group(1))
                     b = self._clean_name(m.group(2))
-                    name = f"{b} {a}".strip() if p.startswith("NOMBRE") else f"{a} {b}".strip()
+                    name = f"{b} {a}".strip() if p.pattern.startswith("NOMBRE") else f"{a} {b}".strip()
                 else:
                     a1 = self._clean_name(m.group(1))
                     a2 = self._clean_name(m.group(2))
@@ -192,7 +213,7 @@ class DniParser(BaseDocumentParser):
         # 3) Fallback: líneas en mayúsculas
         lines = [self._clean_name(ln) for ln in t.splitlines() if ln.strip()]
         print(f"🐛 Lines: {lines}")
-        caps_lines = [ln for ln in lines if re.fullmatch(r"[A-ZÑÁÉÍÓÚ\s]{10,}", ln)]
+        caps_lines = [ln for ln in lines if _RE_CAPS_LINE.fullmatch(ln)]
         print(f"🐛 Caps lines: {caps_lines}")
         if caps_lines:
             cand = max(caps_lines, key=len)
@@ -206,7 +227,7 @@ class DniParser(BaseDocumentParser):
         return "NOT FOUND"
 
     def _clean_name(self, name: str) -> str:
-        return re.sub(r"\s+", " ", (name or "")).strip()
+        return _collapse_ws(name or "")
 
     def _is_garbage_name(self, name: str) -> bool:
         if not name or name == "NOT FOUND":
@@ -222,7 +243,7 @@ class DniParser(BaseDocumentParser):
         if sum(c.isdigit() for c in up) >= 6:
             return True
 
-        if re.search(r"\b(APELLIDOS|NOMBRE|DOCUMENTO|NIF|DNI|SEXO|NACIONALIDAD|FECHA|CADUCIDAD)\b", up):
+        if _RE_NAME_LABELS.search(up):
             return True
 
         if len(up) < 10 or len(up.split()) < 2:
@@ -3,16 +3,168 @@ Parser for FACTURA documents
 Extracts invoice details including subtotal, deductions, final amount, and installer info
 """
 from .base_parser import BaseDocumentParser
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import re
 
 
+# Each group is tried in order; the first match wins.
+# (anchor, pattern): a pattern can only match if its anchor occurs in the
+# uppercased text, so the scan is skipped when it doesn't (None: always run)
+_RE_INVOICE_NUMBER = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        ('FACTURA', r'[Ff]actura\s*[Nn][ºo°]?\s*([A-Z0-9][\w\-]+)'),
+        ('FACTURA', r'[Ff]actura[:\s]+([A-Z]?\d[\w\-]+)'),
+        ('FACTURA', r'[Nn][ºo°]?\s*[Ff]actura[:\s]+([A-Z0-9][\w\-]+)'),
+        (None, r'[Nn][ºo°]\s+([A-Z0-9][\w\-]+)'),
+    )
+)
+_RE_INVOICE_DATE = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        ('FECHA', r'[Ff]echa[:\s]+([\d]{1,2}/[\d]{1,2}/[\d]{4})'),
+        ('/', r'\b(\d{1,2}/\d{1,2}/\d{4})\b'),
+    )
+)
+
+# Homeowner
+_RE_NAME = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        ('MR', r'[Mm]r\.?\s+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]+)'),
+        ('SR', r'[Ss]r[a]?\.?\s+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]+)'),
+        ('CLIENTE', r'[Cc]liente[:\s]+([A-ZÑÁÉÍÓÚ][a-zñáéíóú]+(?:\s+[A-ZÑÁÉÍÓÚ][a-zñáéíóú]+)+)'),
+        ('NOMBRE', r'[Nn]ombre[:\s]+([A-ZÑÁÉÍÓÚ][a-zñáéíóú]+(?:\s+[A-ZÑÁÉÍÓÚ][a-zñáéíóú]+)+)'),
+    )
+)
+_RE_NAME_ADDRESS_TAIL = re.compile(r'\s+(CL|AV|C/|CALLE|PZ|PLAZA).*', re.IGNORECASE)
+_RE_DNI = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        # (digits, letter): an optional '-' between them is left out of both
+        ('DNI', r'[Dd][Nn][Ii][:\s]*(\d{7,8})-?([A-Z])'),
+        ('NIF', r'[Nn][Ii][Ff][:\s]*(\d{7,8})-?([A-Z])'),
+        (None, r'\b(\d{8})-?([A-Z])\b'),
+    )
+)
+_RE_ADDRESS = tuple(
+    (anchor, re.compile(p, re.IGNORECASE))
+    for anchor, p in (
+        (None, r'((?:CL|AV|C/|CALLE|PZ|PLAZA)\s+[^\n]+\n\d{5}\s+[^\n]+)'),
+        (None, r'((?:CL|AV|C/|CALLE|PZ|PLAZA)\s+[^\n]+)'),
+        ('DIRECCI', r'[Dd]irecci[oó]n[:\s]+([^\n]+)'),
+        ('DOMICILIO', r'[Dd]omicilio[:\s]+([^\n]+)'),
+    )
+)
+_RE_EMAIL = re.compile(r'\b([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)\b')
+_RE_PHONE = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        ('TEL', r'[Tt]el(?:[eé]fono)?\.?\s*[:\s]*(\d{9})'),
+        ('TLF', r'[Tt]lf\.?\s*[:\s]*(\d{9})'),
+        ('VIL', r'[Mm][oó]vil\s*[:\s]*(\d{9})'),
+    )
+)
+_RE_PHONE_BARE = re.compile(r'\b([69]\d{8})\b')
+
+# Amounts
+_RE_SUBTOTAL = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        # "Subtotal 1319.68 €" or "Subtotal 1393.39 €"
+        ('SUBTOTAL', r'[Ss]ubtotal\s+([\d.,]+)\s*€'),
+        ('SUB', r'[Ss]ub[-]?total[:\s]*([\d.,]+)\s*€'),
+    )
+)
+_RE_DEDUCTION_NEG = re.compile(r'(-[\d.,]+)\s*€')
+_RE_DEDUCTION_BRACKET = re.compile(r'\[([\d.,]+)\s*€')
+_RE_AMOUNT = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        ('PAGAR', r'[Aa]\s*[Pp]agar[:\s]*([\d.,]+)\s*€'),
+        ('TOTAL', r'(?<![Ss]ub)[Tt]otal[:\s]+([\d.,]+)\s*€'),
+    )
+)
+
+# Installer
+_RE_INSTALLER_NAME = tuple(
+    (anchor, re.compile(p, re.MULTILINE))
+    for anchor, p in (
+        # "ECORENOVA ESPANA;" or "ETL Aislamiento;"
+        ('ECORENOVA', r'(ECORENOVA\s*ESPA[NÑ]A)'),
+        ('ETL', r'(ETL\s*[Aa]islamiento)'),
+        (';', r'^([A-Z][A-Z\s]+);'),  # Company name ending with semicolon
+    )
+)
+_RE_INSTALLER_ADDRESS = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        # "C TUSET, NUM 20 PLANTA 8, PUERTA, 8 08006 BARCELONA"
+        (None, r'([Cc]\s+[A-Z][A-Z\s,]+\d{5}\s+[A-Z]+)'),
+        ('CALLE', r'(CALLE\s+[A-Z][A-Z\s,]+\d{5}\s+[A-Z]+)'),
+    )
+)
+_RE_INSTALLER_CIF = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        (None, r'C\.?I\.?F\.?[:\s]*([AB]\d{8})'),
+        ('CIF', r'CIF[:\s]*([AB]\d{8})'),
+        (None, r'\b([AB]\d{8})\b'),
+    )
+)
+
+# Surface / thickness
+# Only ever run on the uppercased text (_upper_text): they capture digits
+# only, and case-sensitive patterns skip the engine's per-char case folding
+_RE_SURFACE = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        ('SUPERFICIE', r'SUPERFICIE[:\s]*([\d.,]+)\s*M[²2]?'),
+        ('SUPERFICIE', r'SUPERFICIE\s+TOTAL[:\s]*([\d.,]+)\s*M[²2]?'),
+        ('METROS', r'METROS\s+CUADRADOS[:\s]*([\d.,]+)'),
+        (None, r'S\s*[:=]\s*([\d.,]+)'),
+        ('AREA', r'AREA[:\s]*([\d.,]+)\s*M[²2]?'),
+        (None, r'(\d{2,4})\s*M[²2]'),
+        ('METROS', r'(\d{2,4})\s*METROS\s+CUADRADOS'),
+        ('AISLAMIENTO', r'AISLAMIENTO\s+(\d{2,3}(?:\.\d)?)'),  # 50.0 after aislamiento
+    )
+)
+_RE_SURFACE_NEAR_M2 = re.compile(r'(\d{2,4})\s*(?:M[²2]|METROS?\s+CUADRADOS?)')
+# (all of them end in MM)
+_RE_THICKNESS = tuple(
+    (anchor, re.compile(p))
+    for anchor, p in (
+        ('ESPESOR', r'ESPESOR\s+AISLANTE[:\s]*([\d.,]+)\s*MM'),
+        ('GROSOR', r'GROSOR\s+AISLANTE[:\s]*([\d.,]+)\s*MM'),
+        ('AISLANTE', r'AISLANTE\s+DE\s+([\d.,]+)\s*MM'),
+        (None, r'(\d{2,3})\s*MM'),
+    )
+)
+
+
+def _first_match(patterns, text: str, up: str) -> Optional[re.Match]:
+    """First match of the (anchor, pattern) pairs in order, skipping absent anchors."""
+    for anchor, pattern in patterns:
+        if anchor is not None and anchor not in up:
+            continue
+        match = pattern.search(text)
+        if match:
+            return match
+    return None
+
+
 class FacturaParser(BaseDocumentParser):
     """Parser for Factura"""
-    
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._text_upper: Optional[str] = None
+
     def parse(self) -> Dict[str, Any]:
         """Extract all fields from Factura"""
         self.extract_text()
+        # label anchors are looked up in the uppercased text
+        self._text_upper = (self.text or "").upper()
         
         # detect isolation type and whether it was inferred by brand
         isolation_type, isolation_inferred = self._detect_isolation_type(self.text)
@@ -40,152 +192,106 @@ class FacturaParser(BaseDocumentParser):
         }
         
         return result
+
+    def _upper_text(self) -> str:
+        """self.text uppercased, computed once per parse()."""
+        up = self._text_upper
+        if up is None:
+            up = self._text_upper = (self.text or "").upper()
+        return up
     
     def _extract_invoice_number(self) -> str:
         """Extract invoice number"""
-        patterns = [
-            r'[Ff]actura\s*[Nn][ºo°]?\s*([A-Z0-9][\w\-]+)',
-            r'[Ff]actura[:\s]+([A-Z]?\d[\w\-]+)',
-            r'[Nn][ºo°]?\s*[Ff]actura[:\s]+([A-Z0-9][\w\-]+)',
-            r'[Nn][ºo°]\s+([A-Z0-9][\w\-]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return match.group(1).strip()
+        match = _first_match(_RE_INVOICE_NUMBER, self.text, self._upper_text())
+        if match:
+            return match.group(1)
         
         return "NOT FOUND"
     
     def _extract_invoice_date(self) -> str:
         """Extract invoice date"""
-        patterns = [
-            r'[Ff]echa[:\s]+([\d]{1,2}/[\d]{1,2}/[\d]{4})',
-            r'\b(\d{1,2}/\d{1,2}/\d{4})\b',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return match.group(1)
+        match = _first_match(_RE_INVOICE_DATE, self.text, self._upper_text())
+        if match:
+            return match.group(1)
         
         return "NOT FOUND"
     
     def _extract_homeowner_name(self) -> str:
         """Extract customer/homeowner name"""
-        patterns = [
-            r'[Mm]r\.?\s+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]+)',
-            r'[Ss]r[a]?\.?\s+([A-ZÑÁÉÍÓÚ][A-ZÑÁÉÍÓÚ\s]+)',
-            r'[Cc]liente[:\s]+([A-ZÑÁÉÍÓÚ][a-zñáéíóú]+(?:\s+[A-ZÑÁÉÍÓÚ][a-zñáéíóú]+)+)',
-            r'[Nn]ombre[:\s]+([A-ZÑÁÉÍÓÚ][a-zñáéíóú]+(?:\s+[A-ZÑÁÉÍÓÚ][a-zñáéíóú]+)+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
+        up = self._upper_text()
+        for anchor, pattern in _RE_NAME:
+            if anchor not in up:
+                continue
+            match = pattern.search(self.text)
             if match:
                 name = match.group(1).strip()
-                name = re.sub(r'\s+(CL|AV|C/|CALLE|PZ|PLAZA).*', '', name, flags=re.IGNORECASE)
-                if "BONO SOCIAL" not in name.upper() and "PERCEPTORES" not in name.upper():
+                name = _RE_NAME_ADDRESS_TAIL.sub('', name)
+                name_up = name.upper()
+                if "BONO SOCIAL" not in name_up and "PERCEPTORES" not in name_up:
                     return name.strip()
         
         return "NOT FOUND"
     
     def _extract_homeowner_dni(self) -> str:
         """Extract DNI"""
-        patterns = [
-            r'[Dd][Nn][Ii][:\s]*(\d{7,8}[-]?[A-Z])',
-            r'[Nn][Ii][Ff][:\s]*(\d{7,8}[-]?[A-Z])',
-            r'\b(\d{8}[-]?[A-Z])\b',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                dni = match.group(1).replace('-', '')
-                return dni
+        match = _first_match(_RE_DNI, self.text, self._upper_text())
+        if match:
+            return match.group(1) + match.group(2)
         
         return "NOT FOUND"
     
     def _extract_homeowner_address(self) -> str:
         """Extract address"""
-        patterns = [
-            r'((?:CL|AV|C/|CALLE|PZ|PLAZA)\s+[^\n]+\n\d{5}\s+[^\n]+)',
-            r'((?:CL|AV|C/|CALLE|PZ|PLAZA)\s+[^\n]+)',
-            r'[Dd]irecci[oó]n[:\s]+([^\n]+)',
-            r'[Dd]omicilio[:\s]+([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
-            if match:
-                addr = match.group(1).strip()
-                addr = addr.replace('\n', ', ')
-                return addr
+        match = _first_match(_RE_ADDRESS, self.text, self._upper_text())
+        if match:
+            addr = match.group(1).strip()
+            addr = addr.replace('\n', ', ')
+            return addr
         
         return "NOT FOUND"
     
     def _extract_email(self) -> str:
         """Extract email - homeowner's email (first one found after name)"""
-        # Find all emails
-        emails = re.findall(r'\b([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)\b', self.text)
-        
+        if "@" not in self.text:
+            return "NOT FOUND"
+
         # First email is usually the homeowner's
-        if emails:
-            return emails[0]
+        match = _RE_EMAIL.search(self.text)
+        if match:
+            return match.group(1)
         
         return "NOT FOUND"
     
     def _extract_phone(self) -> str:
         """Extract phone number"""
-        patterns = [
-            r'[Tt]el(?:[eé]fono)?\.?\s*[:\s]*(\d{9})',
-            r'[Tt]lf\.?\s*[:\s]*(\d{9})',
-            r'[Mm][oó]vil\s*[:\s]*(\d{9})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return match.group(1)
+        match = _first_match(_RE_PHONE, self.text, self._upper_text())
+        if match:
+            return match.group(1)
         
         # Find standalone 9-digit numbers (Spanish phones)
-        phones = re.findall(r'\b([69]\d{8})\b', self.text)
-        if phones:
-            return phones[0]
+        match = _RE_PHONE_BARE.search(self.text)
+        if match:
+            return match.group(1)
         
         return "NOT FOUND"
     
     def _extract_subtotal(self) -> str:
         """Extract subtotal amount (before deductions)"""
-        patterns = [
-            # "Subtotal 1319.68 €" or "Subtotal 1393.39 €"
-            r'[Ss]ubtotal\s+([\d.,]+)\s*€',
-            r'[Ss]ub[-]?total[:\s]*([\d.,]+)\s*€',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return f"{match.group(1)} €"
+        match = _first_match(_RE_SUBTOTAL, self.text, self._upper_text())
+        if match:
+            return f"{match.group(1)} €"
         
         return "NOT FOUND"
     
     def _extract_deduction(self) -> str:
         """Extract deduction amount (CAE subsidies) - negative number"""
-        patterns = [
-            # Negative number in brackets like "[1392.39€" or "-1318.68€"
-            r'\[?([-]?[\d.,]+)\s*€?\s*\+?',
-            r'(-[\d.,]+)\s*€',
-        ]
-        
-        # Look for negative amounts
-        matches = re.findall(r'(-[\d.,]+)\s*€', self.text)
-        if matches:
-            # Return the largest negative deduction
-            return f"{matches[0]} €"
+        # Look for negative amounts (the first one wins)
+        match = _RE_DEDUCTION_NEG.search(self.text)
+        if match:
+            return f"{match.group(1)} €"
         
         # Look for bracketed amounts like [1392.39€
-        match = re.search(r'\[([\d.,]+)\s*€', self.text)
+        match = _RE_DEDUCTION_BRACKET.search(self.text)
         if match:
             return f"-{match.group(1)} €"
         
@@ -193,80 +299,44 @@ class FacturaParser(BaseDocumentParser):
     
     def _extract_amount(self) -> str:
         """Extract total amount (A pagar)"""
-        patterns = [
-            r'[Aa]\s*[Pp]agar[:\s]*([\d.,]+)\s*€',
-            r'(?<![Ss]ub)[Tt]otal[:\s]+([\d.,]+)\s*€',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return f"{match.group(1)} €"
+        match = _first_match(_RE_AMOUNT, self.text, self._upper_text())
+        if match:
+            return f"{match.group(1)} €"
         
         return "NOT FOUND"
     
     def _extract_installer_name(self) -> str:
         """Extract installer company name from bottom of invoice"""
-        patterns = [
-            # "ECORENOVA ESPANA;" or "ETL Aislamiento;"
-            r'(ECORENOVA\s*ESPA[NÑ]A)',
-            r'(ETL\s*[Aa]islamiento)',
-            r'^([A-Z][A-Z\s]+);',  # Company name ending with semicolon
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.MULTILINE)
-            if match:
-                return match.group(1).strip()
+        match = _first_match(_RE_INSTALLER_NAME, self.text, self._upper_text())
+        if match:
+            return match.group(1).strip()
         
         return "NOT FOUND"
     
     def _extract_installer_address(self) -> str:
         """Extract installer address from bottom of invoice"""
-        patterns = [
-            # "C TUSET, NUM 20 PLANTA 8, PUERTA, 8 08006 BARCELONA"
-            r'([Cc]\s+[A-Z][A-Z\s,]+\d{5}\s+[A-Z]+)',
-            r'(CALLE\s+[A-Z][A-Z\s,]+\d{5}\s+[A-Z]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return match.group(1).strip()
+        match = _first_match(_RE_INSTALLER_ADDRESS, self.text, self._upper_text())
+        if match:
+            return match.group(1).strip()
         
         return "NOT FOUND"
     
     def _extract_installer_cif(self) -> str:
         """Extract installer CIF"""
-        patterns = [
-            r'C\.?I\.?F\.?[:\s]*([AB]\d{8})',
-            r'CIF[:\s]*([AB]\d{8})',
-            r'\b([AB]\d{8})\b',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return match.group(1)
+        match = _first_match(_RE_INSTALLER_CIF, self.text, self._upper_text())
+        if match:
+            return match.group(1)
         
         return "NOT FOUND"
     
     def _extract_s(self) -> str:
         """Extract surface area (S) in m²"""
         # First, try specific patterns
-        patterns = [
-            r'[Ss]uperficie[:\s]*([\d.,]+)\s*m[²2]?',
-            r'[Ss]uperficie\s+total[:\s]*([\d.,]+)\s*m[²2]?',
-            r'[Mm]etros\s+cuadrados[:\s]*([\d.,]+)',
-            r'[Ss]\s*[:=]\s*([\d.,]+)',
-            r'[Aa]rea[:\s]*([\d.,]+)\s*m[²2]?',
-            r'(\d{2,4})\s*m[²2]',
-            r'(\d{2,4})\s*metros\s+cuadrados',
-            r'aislamiento\s+(\d{2,3}(?:\.\d)?)',  # 50.0 after aislamiento
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
+        up = self._upper_text()
+        for anchor, pattern in _RE_SURFACE:
+            if anchor is not None and anchor not in up:
+                continue
+            match = pattern.search(up)
             if match:
                 s_value = match.group(1).replace(',', '.')
                 try:
@@ -277,7 +347,7 @@ class FacturaParser(BaseDocumentParser):
                     continue
         
         # Fallback: look for any number near m²
-        match = re.search(r'(\d{2,4})\s*(?:m[²2]|metros?\s+cuadrados?)', self.text, re.IGNORECASE)
+        match = _RE_SURFACE_NEAR_M2.search(up)
         if match:
             s_value = match.group(1)
             try:
@@ -295,15 +365,13 @@ class FacturaParser(BaseDocumentParser):
     
     def _extract_isolation_thickness(self) -> str:
         """Extract isolation thickness in mm"""
-        patterns = [
-            r'[Ee]spesor\s+aislante[:\s]*([\d.,]+)\s*mm',
-            r'[Gg]rosor\s+aislante[:\s]*([\d.,]+)\s*mm',
-            r'aislante\s+de\s+([\d.,]+)\s*mm',
-            r'(\d{2,3})\s*mm',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
+        up = self._upper_text()
+        if "MM" not in up:
+            return "NOT FOUND"
+        for anchor, pattern in _RE_THICKNESS:
+            if anchor is not None and anchor not in up:
+                continue
+            match = pattern.search(up)
             if match:
                 thickness = match.group(1).replace(',', '.')
                 try:
@@ -2,11 +2,155 @@
 Parser for FICHA RES020 documents
 """
 
-from .base_parser import BaseDocumentParser
-from typing import Dict, Any
+from .base_parser import BaseDocumentParser, _fix_ocr_confusions
+from typing import Dict, Any, Optional, Tuple
 import re
 
 
+# _normalize: OCR quote variants -> ASCII quotes
+_QUOTE_FIXES = (("’", "'"), ("´", "'"), ("`", "'"), ("″", "''"))
+
+# Each tuple is tried in order; the first usable match wins
+
+# Homeowner
+_RE_NAME = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:propietario|titular|dueño)[:\s]*([^\n\r]{10,50})',
+        r'(?:nombre|name)[:\s]*([^\n\r]{10,50})',
+    )
+)
+_RE_ADDRESS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:domicilio|dirección|address)[:\s]*([^\n\r]{15,80})',
+        r'(?:ubicación|location)[:\s]*([^\n\r]{15,80})',
+    )
+)
+_RE_DNI = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:dni|nie|documento)[:\s]*([0-9]{8}[A-Z]|[XYZ][0-9]{7}[A-Z])',
+        r'(?:nif|cif)[:\s]*([0-9]{8}[A-Z]|[XYZ][0-9]{7}[A-Z])',
+    )
+)
+_DNI_LABELS = ("DNI", "NIE", "DOCUMENTO", "NIF", "CIF")
+
+# ACT code / catastral / energy
+_RE_ACT_CODE = re.compile(r"(RES0*\d{2,3})", re.IGNORECASE)
+_RE_ACT_ZEROS = re.compile(r"RES0+(\d)")
+_RE_ACT_CODE_LABELLED = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:código\s*act|act\s*code)[:\s]*(RES\s*0*\d{2,3})',
+        r'(?:tipo\s*de\s*act|act\s*type)[:\s]*(RES\s*0*\d{2,3})',
+        r'(?:medida|actuación)[:\s]*(RES\s*0*\d{2,3})',
+    )
+)
+_RE_CATASTRAL = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:referencia\s*catastral|catastral\s*ref)[:\s]*([0-9A-Z\s]{14,20})',
+        r'(?:ref\s*catastral)[:\s]*([0-9A-Z\s]{14,20})',
+    )
+)
+_RE_ENERGY_KWH_YEAR = re.compile(r"(\d[\d\s.,]{2,})\s*k[wW]?[hH]\s*/\s*a(?:ñ|n)o", re.IGNORECASE)
+
+# Dates / price
+_RE_SELL_PRICE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
+        r"venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
+        r"([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
+        r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*euros?\s*por\s*[kI]Wh",
+    )
+)
+_SPANISH_MONTHS = {
+    "enero": "01",
+    "febrero": "02",
+    "marzo": "03",
+    "abril": "04",
+    "mayo": "05",
+    "junio": "06",
+    "julio": "07",
+    "agosto": "08",
+    "septiembre": "09",
+    "octubre": "10",
+    "noviembre": "11",
+    "diciembre": "12",
+}
+_RE_START_DATE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"inici[oó]\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
+        r"[Ff]echa.*?inicio[:\s]+([\d/]+)",
+    )
+)
+_RE_FINISH_DATE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"finaliz[oó].*?el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
+        r"[Ff]echa.*?fin[:\s]+([\d/]+)",
+    )
+)
+
+# Thermal values / surface / zone
+_RE_FP = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:fp|factor\s*p)[:=\s]*([0-9.,]+)',
+        r'(?:p\s*factor)[:=\s]*([0-9.,]+)',
+        r'Fp[:=\s]*([0-9.,]+)',
+    )
+)
+_RE_UI = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:ui|transmitancia)[:=\s]*([0-9.,]+)',
+        r'(?:u\s*inicial)[:=\s]*([0-9.,]+)',
+        r'Ui[:=\s]*([0-9.,]+)',
+    )
+)
+_RE_UF = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:uf|u\s*final)[:=\s]*([0-9.,]+)',
+        r'(?:transmitancia\s*final)[:=\s]*([0-9.,]+)',
+        r'Uf[:=\s]*([0-9.,]+)',
+    )
+)
+_RE_SURFACE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:superficie|surface|área)[:=\s]*([0-9.,]+)',
+        r'(?:s\s*=|superficie\s*=)[:=\s]*([0-9.,]+)',
+        r'S[:=\s]*([0-9.,]+)',
+    )
+)
+_RE_CLIMATIC_ZONE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:zona\s*climática|climatic\s*zone)[:\s]*([A-Z0-9]+)',
+        r'(?:zona\s*=|zone\s*=)[:\s]*([A-Z0-9]+)',
+    )
+)
+_RE_ISOLATION_THICKNESS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:espesor\s*aislamiento|isolation\s*thickness)[:\s]*([0-9.,]+)',
+        r'(?:grosor\s*aislante)[:\s]*([0-9.,]+)',
+    )
+)
+
+# Lifespan (run on the accent-folded text). "años" needs no entry of its
+# own: folding ñ already turns it into "anos"; the last one is mis-decoded UTF-8
+_LIFESPAN_FOLDS = (("ú", "u"), ("ó", "o"), ("ñ", "n"), ("a\xc3\xb1os", "anos"))
+_RE_LIFESPAN_LABEL = re.compile(r"(?:vida\s*util|vida\s*útil|duraci[oó]n|duracion|lifespan)[:\s\-]*([0-9]{1,3})", re.IGNORECASE)
+_RE_LIFESPAN_YEARS = re.compile(r"\b([0-9]{1,3})\s*(?:a[nn]os|anos|years)\b", re.IGNORECASE)
+_RE_LIFESPAN_NEAR = re.compile(r"(vida|util|lifespan).{0,30}?([0-9]{1,3})", re.IGNORECASE)
+
+
 class FichaParser(BaseDocumentParser):
     """Parser for Ficha RES020 documents"""
 
@@ -15,22 +159,19 @@ class FichaParser(BaseDocumentParser):
         if not t:
             return ""
 
-        # Basic normalization for OCR text
-        t = (
-            t.replace("’", "'")
-            .replace("´", "'")
-            .replace("`", "'")
-            .replace("″", "''")
-        )
+        # Basic normalization for OCR text (most texts have none of these)
+        for bad, good in _QUOTE_FIXES:
+            if bad in t:
+                t = t.replace(bad, good)
 
         # Common OCR errors in Spanish
-        t = t.replace("Le6n", "León").replace("Direcci6n", "Dirección").replace("ubicaci6n", "ubicación")
-
-        return t
+        return _fix_ocr_confusions(t)
 
     def parse(self) -> Dict[str, Any]:
         self.extract_text()
         t = self._normalize(self.text)
+        # for the literal label checks that gate some extractors
+        up = t.upper()
         # Extract lifespan and provide fallback from context (CERTIFICADO/CONTRATO)
         lifespan = self._extract_lifespan(t)
         if not lifespan:
@@ -49,13 +190,13 @@ class FichaParser(BaseDocumentParser):
             'document_type': 'FICHA',
             'homeowner_name': self._extract_homeowner_name(t),
             'homeowner_address': self._extract_homeowner_address(t),
-            'homeowner_dni': self._extract_homeowner_dni(t),
-            'act_code': self._extract_act_code(t),
-            'catastral_ref': self._extract_catastral_ref(t),
-            'energy_savings': self._extract_energy_savings(t),
+            'homeowner_dni': self._extract_homeowner_dni(t, up),
+            'act_code': self._extract_act_code(t, up),
+            'catastral_ref': self._extract_catastral_ref(t, up),
+            'energy_savings': self._extract_energy_savings(t, up),
             'start_date': self._extract_start_date(t),
             'finish_date': self._extract_finish_date(t),
-            'sell_price': self._extract_sell_price(t),
+            'sell_price': self._extract_sell_price(t, up),
             'fp': self._extract_fp(t),
             'ui': self._extract_ui(t),
             'uf': self._extract_uf(t),
@@ -67,80 +208,57 @@ class FichaParser(BaseDocumentParser):
 
     def _extract_homeowner_name(self, text: str) -> str:
         """Extract homeowner name from ficha"""
-        patterns = [
-            r'(?:propietario|titular|dueño)[:\s]*([^\n\r]{10,50})',
-            r'(?:nombre|name)[:\s]*([^\n\r]{10,50})',
-        ]
-        name = self._find_first_pattern(text, patterns)
+        name = self._find_first_pattern(text, _RE_NAME)
         if name and "BONO SOCIAL" not in name.upper() and "PERCEPTORES" not in name.upper():
             return name
         return "NOT FOUND"
 
     def _extract_homeowner_address(self, text: str) -> str:
         """Extract homeowner address from ficha"""
-        patterns = [
-            r'(?:domicilio|dirección|address)[:\s]*([^\n\r]{15,80})',
-            r'(?:ubicación|location)[:\s]*([^\n\r]{15,80})',
-        ]
-        return self._find_first_pattern(text, patterns)
-
-    def _extract_homeowner_dni(self, text: str) -> str:
-        """Extract homeowner DNI from ficha"""
-        patterns = [
-            r'(?:dni|nie|documento)[:\s]*([0-9]{8}[A-Z]|[XYZ][0-9]{7}[A-Z])',
-            r'(?:nif|cif)[:\s]*([0-9]{8}[A-Z]|[XYZ][0-9]{7}[A-Z])',
-        ]
-        return self._find_first_pattern(text, patterns)
-
-    def _extract_act_code(self, text: str) -> str:
+        return self._find_first_pattern(text, _RE_ADDRESS)
+
+    def _extract_homeowner_dni(self, text: str, up: Optional[str] = None) -> str:
+        """Extract homeowner DNI from ficha (`up` is text.upper() if already computed)"""
+        if up is None:
+            up = text.upper()
+        # every pattern starts with one of these labels
+        if not any(label in up for label in _DNI_LABELS):
+            return ""
+        return self._find_first_pattern(text, _RE_DNI)
+
+    def _extract_act_code(self, text: str, up: Optional[str] = None) -> str:
         """Extract ACT code from ficha - busca RES010 o RES020"""
-        m = re.search(r"(RES0*\d{2,3})", text, re.IGNORECASE)
+        # every pattern (plain and labelled) contains the literal RES
+        if "RES" not in (up if up is not None else text.upper()):
+            return ""
+        m = _RE_ACT_CODE.search(text)
         if m:
             code = m.group(1).upper()
-            code = re.sub(r"RES0+(\d)", r"RES0\1", code)  # normaliza RES00020 -> RES020
+            code = _RE_ACT_ZEROS.sub(r"RES0\1", code)  # normaliza RES00020 -> RES020
             return code
         
-        patterns = [
-            r'(?:código\s*act|act\s*code)[:\s]*(RES\s*0*\d{2,3})',
-            r'(?:tipo\s*de\s*act|act\s*type)[:\s]*(RES\s*0*\d{2,3})',
-            r'(?:medida|actuación)[:\s]*(RES\s*0*\d{2,3})',
-        ]
-        
-        for pattern in patterns:
-            m = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _RE_ACT_CODE_LABELLED:
+            m = pattern.search(text)
             if m:
                 code = m.group(1).upper().replace(" ", "")
-                code = re.sub(r"RES0+(\d)", r"RES0\1", code)
+                code = _RE_ACT_ZEROS.sub(r"RES0\1", code)
                 return code
         
         return ""
 
-    def _extract_catastral_ref(self, text: str) -> str:
+    def _extract_catastral_ref(self, text: str, up: Optional[str] = None) -> str:
         """Extract catastral reference from ficha"""
-        patterns = [
-            r'(?:referencia\s*catastral|catastral\s*ref)[:\s]*([0-9A-Z\s]{14,20})',
-            r'(?:ref\s*catastral)[:\s]*([0-9A-Z\s]{14,20})',
-        ]
-        return self._find_first_pattern(text, patterns)
-
-    def _extract_energy_savings(self, text: str) -> str:
-        """Extract energy savings from ficha"""
-        patterns = [
-            r'(?:ahorro\s*energético|energy\s*savings)[:\s]*([0-9.,]+)',
-            r'(?:kwh|kilowatts? hora)[:\s]*([0-9.,]+)',
-        ]
-        return self._find_first_pattern(text, patterns)
+        if "CATASTRAL" not in (up if up is not None else text.upper()):
+            return ""
+        return self._find_first_pattern(text, _RE_CATASTRAL)
 
-    def _extract_sell_price(self, text: str) -> str:
+    def _extract_sell_price(self, text: str, up: Optional[str] = None) -> str:
         """Extract sell price (€/kWh) from ficha"""
-        patterns = [
-            r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
-            r"venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
-            r"([\d\s,]+(?:\.\d+)?)\s*€/[kI]Wh",
-            r"precio\s+de\s+venta[^€\d]*([\d\s,]+(?:\.\d+)?)\s*euros?\s*por\s*[kI]Wh",
-        ]
-        for pattern in patterns:
-            m = re.search(pattern, text, re.IGNORECASE)
+        # every pattern ends in kWh (or its OCR misread IWh)
+        if "WH" not in (up if up is not None else text.upper()):
+            return ""
+        for pattern in _RE_SELL_PRICE:
+            m = pattern.search(text)
             if m:
                 price = m.group(1).replace(",", ".").replace(" ", "")
                 try:
@@ -152,64 +270,20 @@ class FichaParser(BaseDocumentParser):
 
     def _extract_start_date(self, text: str) -> str:
         """Extract start date from ficha"""
-        patterns = [
-            r"inici[oó]\s+el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
-            r"[Ff]echa.*?inicio[:\s]+([\d/]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 3:
-                    day, month, year = match.groups()
-                    months = {
-                        "enero": "01",
-                        "febrero": "02",
-                        "marzo": "03",
-                        "abril": "04",
-                        "mayo": "05",
-                        "junio": "06",
-                        "julio": "07",
-                        "agosto": "08",
-                        "septiembre": "09",
-                        "octubre": "10",
-                        "noviembre": "11",
-                        "diciembre": "12",
-                    }
-                    month_num = months.get(month.lower(), month)
-                    return f"{day}/{month_num}/{year}"
-                else:
-                    return match.group(1)
-
-        return ""
+        return self._extract_spanish_date(text, _RE_START_DATE)
 
     def _extract_finish_date(self, text: str) -> str:
         """Extract finish date from ficha"""
-        patterns = [
-            r"finaliz[oó].*?el\s+(\d+)\s+de\s+(\w+)\s+de\s+(\d{4})",
-            r"[Ff]echa.*?fin[:\s]+([\d/]+)",
-        ]
+        return self._extract_spanish_date(text, _RE_FINISH_DATE)
 
+    def _extract_spanish_date(self, text: str, patterns: Tuple[re.Pattern, ...]) -> str:
+        """First date matched by `patterns`: "3 de marzo de 2024" -> "3/03/2024", "d/m/y" as is."""
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) == 3:
                     day, month, year = match.groups()
-                    months = {
-                        "enero": "01",
-                        "febrero": "02",
-                        "marzo": "03",
-                        "abril": "04",
-                        "mayo": "05",
-                        "junio": "06",
-                        "julio": "07",
-                        "agosto": "08",
-                        "septiembre": "09",
-                        "octubre": "10",
-                        "noviembre": "11",
-                        "diciembre": "12",
-                    }
-                    month_num = months.get(month.lower(), month)
+                    month_num = _SPANISH_MONTHS.get(month.lower(), month)
                     return f"{day}/{month_num}/{year}"
                 else:
                     return match.group(1)
@@ -218,62 +292,40 @@ class FichaParser(BaseDocumentParser):
 
     def _extract_fp(self, text: str) -> str:
         """Extract Fp from ficha"""
-        patterns = [
-            r'(?:fp|factor\s*p)[:=\s]*([0-9.,]+)',
-            r'(?:p\s*factor)[:=\s]*([0-9.,]+)',
-            r'Fp[:=\s]*([0-9.,]+)',
-        ]
-        return self._find_first_pattern(text, patterns)
+        return self._find_first_pattern(text, _RE_FP)
 
     def _extract_ui(self, text: str) -> str:
         """Extract Ui from ficha"""
-        patterns = [
-            r'(?:ui|transmitancia)[:=\s]*([0-9.,]+)',
-            r'(?:u\s*inicial)[:=\s]*([0-9.,]+)',
-            r'Ui[:=\s]*([0-9.,]+)',
-        ]
-        return self._find_first_pattern(text, patterns)
+        return self._find_first_pattern(text, _RE_UI)
 
     def _extract_uf(self, text: str) -> str:
         """Extract Uf from ficha"""
-        patterns = [
-            r'(?:uf|u\s*final)[:=\s]*([0-9.,]+)',
-            r'(?:transmitancia\s*final)[:=\s]*([0-9.,]+)',
-            r'Uf[:=\s]*([0-9.,]+)',
-        ]
-        return self._find_first_pattern(text, patterns)
+        return self._find_first_pattern(text, _RE_UF)
 
     def _extract_surface(self, text: str) -> str:
         """Extract surface area from ficha"""
-        patterns = [
-            r'(?:superficie|surface|área)[:=\s]*([0-9.,]+)',
-            r'(?:s\s*=|superficie\s*=)[:=\s]*([0-9.,]+)',
-            r'S[:=\s]*([0-9.,]+)',
-        ]
-        return self._find_first_pattern(text, patterns)
+        return self._find_first_pattern(text, _RE_SURFACE)
 
     def _extract_climatic_zone(self, text: str) -> str:
         """Extract climatic zone from ficha"""
-        patterns = [
-            r'(?:zona\s*climática|climatic\s*zone)[:\s]*([A-Z0-9]+)',
-            r'(?:zona\s*=|zone\s*=)[:\s]*([A-Z0-9]+)',
-        ]
-        return self._find_first_pattern(text, patterns)
+        return self._find_first_pattern(text, _RE_CLIMATIC_ZONE)
 
     def _extract_isolation_thickness(self, text: str) -> str:
         """Extract isolation thickness from ficha"""
-        patterns = [
-            r'(?:espesor\s*aislamiento|isolation\s*thickness)[:\s]*([0-9.,]+)',
-            r'(?:grosor\s*aislante)[:\s]*([0-9.,]+)',
-        ]
-        return self._find_first_pattern(text, patterns)
+        return self._find_first_pattern(text, _RE_ISOLATION_THICKNESS)
 
-    def _extract_energy_savings(self, text: str) -> str:
+    def _extract_energy_savings(self, text: str, up: Optional[str] = None) -> str:
         """Extract energy savings from ficha"""
-        m = re.search(r"(\d[\d\s.,]{2,})\s*k[wW]?[hH]\s*/\s*a(?:ñ|n)o", text, re.IGNORECASE)
+        # the pattern needs "kWh" or "kh" followed (after spaces) by "/"
+        if up is None:
+            up = text.upper()
+        if "/" not in up or ("KWH" not in up and "KH" not in up):
+            return ""
+        m = _RE_ENERGY_KWH_YEAR.search(text)
         if m:
             raw = m.group(1)
-            value = re.sub(r"[^\d]", "", raw)
+            # the group is only digits, whitespace, "." and ","
+            value = "".join(raw.split()).replace(".", "").replace(",", "")
             if not value:
                 return ""
             try:
@@ -292,25 +344,27 @@ class FichaParser(BaseDocumentParser):
         # Normalize common OCR/encoding issues for matching
         t = (text or "")
         # Replace common accented variants and OCR mistakes
-        t_norm = t.replace("ú", "u").replace("ó", "o").replace("ñ", "n")
-        t_norm = t_norm.replace("años", "anos").replace("a\xc3\xb1os", "anos")
+        t_norm = t
+        for bad, good in _LIFESPAN_FOLDS:
+            if bad in t_norm:
+                t_norm = t_norm.replace(bad, good)
 
         # Try explicit labels first: 'vida útil', 'duracion', 'lifespan'
-        m = re.search(r"(?:vida\s*util|vida\s*útil|duraci[oó]n|duracion|lifespan)[:\s\-]*([0-9]{1,3})", t_norm, re.IGNORECASE)
+        m = _RE_LIFESPAN_LABEL.search(t_norm)
         if m:
             val = m.group(1).strip()
             if val.isdigit() and 1 <= int(val) <= 100:
                 return val
 
         # General fallback: any number followed by años/anos/years
-        m2 = re.search(r"\b([0-9]{1,3})\s*(?:a[nn]os|anos|years)\b", t_norm, re.IGNORECASE)
+        m2 = _RE_LIFESPAN_YEARS.search(t_norm)
         if m2:
             val = m2.group(1).strip()
             if val.isdigit() and 1 <= int(val) <= 100:
                 return val
 
         # Last resort: any standalone small integer that looks like years near the word 'vida' or 'util'
-        m3 = re.search(r"(vida|util|lifespan).{0,30}?([0-9]{1,3})", t_norm, re.IGNORECASE)
+        m3 = _RE_LIFESPAN_NEAR.search(t_norm)
         if m3:
             val = m3.group(2).strip()
             if val.isdigit() and 1 <= int(val) <= 100:
@@ -318,10 +372,10 @@ class FichaParser(BaseDocumentParser):
 
         return ""
 
-    def _find_first_pattern(self, text: str, patterns: list) -> str:
+    def _find_first_pattern(self, text: str, patterns: Tuple[re.Pattern, ...]) -> str:
         """Find first matching pattern"""
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 result = match.group(1).strip()
                 if len(result) > 3:  # Avoid garbage matches
@@ -7,6 +7,32 @@ from typing import Dict, Any
 import re
 
 
+# Each tuple is tried in order; the first match wins
+_RE_REGISTRATION_DATE = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'[Ff]echa[:\s]+(?:de\s+)?(?:registro|inscripci[oó]n)[:\s]+([\d/]+)',
+        r'(\d{2}/\d{2}/\d{4})',
+    )
+)
+_RE_REGISTRATION_NUMBER = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'[Nn][úuº.]*\s*[Rr]egistro[:\s]+([A-Z0-9-]+)',
+        r'[Rr]egistro[:\s]+n[úuº.]*\s*([A-Z0-9-]+)',
+    )
+)
+_RE_ADDRESS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'[Dd]irecci[oó]n[:\s]+(.+?)(?:\n|Referencia)',
+        r'[Dd]omicilio[:\s]+(.+?)(?:\n|CP)',
+    )
+)
+_RE_CATASTRAL = re.compile(r'referencia catastral[^0-9A-Z]*([0-9A-Z]+)', re.IGNORECASE)
+_RE_CATASTRAL_OK = re.compile(r'^[0-9]+[A-Z]+[0-9]+[A-Z]+[0-9]+[A-Z]+$')
+
+
 class RegistroParser(BaseDocumentParser):
     """Parser for Registro CEE"""
     
@@ -26,13 +52,8 @@ class RegistroParser(BaseDocumentParser):
     
     def _extract_registration_date(self) -> str:
         """Extract registration date"""
-        patterns = [
-            r'[Ff]echa[:\s]+(?:de\s+)?(?:registro|inscripci[oó]n)[:\s]+([\d/]+)',
-            r'(\d{2}/\d{2}/\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
+        for pattern in _RE_REGISTRATION_DATE:
+            match = pattern.search(self.text)
             if match:
                 return match.group(1)
         
@@ -40,13 +61,8 @@ class RegistroParser(BaseDocumentParser):
     
     def _extract_registration_number(self) -> str:
         """Extract registration number"""
-        patterns = [
-            r'[Nn][úuº.]*\s*[Rr]egistro[:\s]+([A-Z0-9-]+)',
-            r'[Rr]egistro[:\s]+n[úuº.]*\s*([A-Z0-9-]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
+        for pattern in _RE_REGISTRATION_NUMBER:
+            match = pattern.search(self.text)
             if match:
                 return match.group(1).strip()
         
@@ -54,13 +70,8 @@ class RegistroParser(BaseDocumentParser):
     
     def _extract_address(self) -> str:
         """Extract address"""
-        patterns = [
-            r'[Dd]irecci[oó]n[:\s]+(.+?)(?:\n|Referencia)',
-            r'[Dd]omicilio[:\s]+(.+?)(?:\n|CP)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.text, re.IGNORECASE)
+        for pattern in _RE_ADDRESS:
+            match = pattern.search(self.text)
             if match:
                 return match.group(1).strip()
         
@@ -68,12 +79,11 @@ class RegistroParser(BaseDocumentParser):
     
     def _extract_catastral_ref(self) -> str:
         """Extract catastral reference"""
-        pattern = r'referencia catastral[^0-9A-Z]*([0-9A-Z]+)'
-        match = re.search(pattern, self.text, re.IGNORECASE)
+        match = _RE_CATASTRAL.search(self.text)
         if match:
             catastral = match.group(1).strip()
-            catastral = re.sub(r'\s+', '', catastral)
-            if re.match(r'^[0-9]+[A-Z]+[0-9]+[A-Z]+[0-9]+[A-Z]+$', catastral):
+            catastral = "".join(catastral.split())
+            if _RE_CATASTRAL_OK.match(catastral):
                 return catastral
         
         return "NOT FOUND"
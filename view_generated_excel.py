@@ -1,11 +1,12 @@
 import openpyxl
 
 excel_path = 'data/output/ZALAMA LORA BENITO_Checks.xlsx'
-wb = openpyxl.load_workbook(excel_path)
+# read-only streams rows instead of loading the whole workbook
+wb = openpyxl.load_workbook(excel_path, read_only=True)
 ws = wb.active
 
 print("\n=== EXCEL GENERADO ===\n")
-for i, row in enumerate(ws.iter_rows(values_only=True), 1):
-    if i > 30:  # Primeras 30 filas
-        break
+for i, row in enumerate(ws.iter_rows(max_row=30, values_only=True), 1):  # Primeras 30 filas
     print(f"Row {i}: {row}")
+
+wb.close()
@@ -1,7 +1,8 @@
 import openpyxl
 
 excel_path = 'data/DE PAZ FRANCO QUINTILIANA_Checks.xlsx'
-wb = openpyxl.load_workbook(excel_path)
+# read-only streams rows instead of loading the whole workbook
+wb = openpyxl.load_workbook(excel_path, read_only=True)
 
 print("=== SHEETS ===")
 print(wb.sheetnames)
@@ -11,7 +12,7 @@ print()
 ws = wb[wb.sheetnames[0]]
 
 print("=== FIRST 20 ROWS ===")
-for i, row in enumerate(ws.iter_rows(values_only=True), 1):
-    if i > 20:
-        break
+for i, row in enumerate(ws.iter_rows(max_row=20, values_only=True), 1):
     print(f"Row {i}: {row}")
+
+wb.close()